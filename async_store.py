@@ -0,0 +1,88 @@
+import asyncio
+
+from task_4 import Product, ProductStore
+
+
+# --- Клас AsyncProductStore ---
+class AsyncProductStore:
+    """
+    Асинхронний фасад над ProductStore для обробки замовлень, що надходять із мережі.
+    Замовлення потрапляють в обмежену чергу (asyncio.Queue): коли вона заповнена,
+    submit чекає, доки звільниться місце (зворотний тиск на джерело замовлень).
+    Пул задач-обробників розбирає чергу. Окремі замки не потрібні: продаж синхронний і не
+    містить точок await, а цикл подій однопотоковий, тож кожне замовлення виконується
+    атомарно, а замовлення на один продукт — у порядку, в якому обробники беруть їх із черги.
+    """
+    def __init__(self, store: ProductStore = None, workers: int = 64, queue_size: int = 10_000):
+        self.store = store if store is not None else ProductStore()
+        self.workers = workers
+        self._queue = asyncio.Queue(maxsize=queue_size)
+        self._worker_tasks = []
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def start(self):
+        """Запускає задачі-обробники черги в поточному циклі подій."""
+        if not self._worker_tasks:
+            self._worker_tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def close(self):
+        """Дочікується обробки всіх замовлень у черзі та зупиняє обробники."""
+        await self._queue.join()
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+    async def add(self, product: Product, amount: int):
+        self.store.add(product, amount)
+
+    async def submit(self, product_name: str, amount: int) -> asyncio.Future:
+        """
+        Ставить замовлення в чергу й повертає Future з його результатом.
+        Якщо черга заповнена, чекає на вільне місце.
+        """
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((product_name, amount, future))
+        return future
+
+    async def sell(self, product_name: str, amount: int):
+        """Продає товар через чергу замовлень і чекає на результат (помилки продажу прокидаються далі)."""
+        return await (await self.submit(product_name, amount))
+
+    async def _worker(self):
+        while True:
+            product_name, amount, future = await self._queue.get()
+            try:
+                self.store.sell_product(product_name, amount)
+                if not future.done():
+                    future.set_result(None)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+
+# --- ТЕСТУВАННЯ: має бути поза класами ---
+if __name__ == "__main__":
+    print("\n--- Тестування AsyncProductStore ---")
+
+    async def main():
+        async with AsyncProductStore(workers=8, queue_size=16) as s:
+            await s.add(Product('Food', 'Ramen', 1.5), 300)
+            await s.add(Product('Sport', 'Football T-Shirt', 100), 10)
+            await asyncio.gather(*(s.sell('Ramen', 1) for _ in range(100)), s.sell('Football T-Shirt', 5))
+            assert s.store.get_product_info('Ramen') == ('Ramen', 200)
+            assert s.store.get_product_info('Football T-Shirt') == ('Football T-Shirt', 5)
+        print("✅ Асинхронні продажі оброблено.")
+
+    asyncio.run(main())
+
+    print("\nВсі тести пройшли успішно!")
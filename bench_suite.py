@@ -0,0 +1,296 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import task_3
+import task_4
+from task_1 import Student, Teacher
+from task_2 import Mathematician
+
+
+# --- Генератори синтетичних даних ---
+def make_products(module, n: int, rng: random.Random, n_types: int = 50) -> list:
+    """Створює n продуктів класу module.Product з випадковими типами та цінами."""
+    return [module.Product(f"Type-{rng.randrange(n_types)}", f"Product-{i}", round(rng.uniform(1, 500), 2))
+            for i in range(n)]
+
+
+def make_store(module, n: int, rng: random.Random, amount: int = 1_000_000):
+    """Створює магазин module.ProductStore з n продуктами по amount одиниць."""
+    store = module.ProductStore()
+    for product in make_products(module, n, rng):
+        store.add(product, amount)
+    return store
+
+
+def make_numbers(n: int, rng: random.Random) -> list:
+    return [rng.randint(-10_000, 10_000) for _ in range(n)]
+
+
+def make_years(n: int, rng: random.Random) -> list:
+    return [rng.randint(1900, 2100) for _ in range(n)]
+
+
+def make_students(n: int, rng: random.Random) -> list:
+    return [Student(f"Student-{i}", rng.randint(6, 18), rng.choice(('Жінка', 'Чоловік')), f"S{i}", rng.randint(1, 11))
+            for i in range(n)]
+
+
+# --- Сценарії ---
+class Case:
+    """
+    Сценарій бенчмарку: setup(scale, rng) готує стан, op(state, i) виконує одну операцію.
+    ops(scale) визначає кількість операцій для заданого масштабу.
+    """
+    def __init__(self, name: str, setup, op, ops=lambda scale: scale):
+        self.name = name
+        self.setup = setup
+        self.op = op
+        self.ops = ops
+
+
+def _store_cases(module, prefix: str) -> list:
+    def setup_add(scale, rng):
+        return module.ProductStore(), make_products(module, scale, rng)
+
+    def setup_store(scale, rng):
+        store = make_store(module, scale, rng)
+        return store, list(store.products), sorted(store._names_by_type)
+
+    return [
+        Case(f"{prefix}.add", setup_add, lambda state, i: state[0].add(state[1][i], 1)),
+        Case(f"{prefix}.sell_product", setup_store,
+             lambda state, i: state[0].sell_product(state[1][i % len(state[1])], 1)),
+        Case(f"{prefix}.set_discount[name]", setup_store,
+             lambda state, i: state[0].set_discount(state[1][i % len(state[1])], i % 50)),
+        Case(f"{prefix}.set_discount[type]", setup_store,
+             lambda state, i: state[0].set_discount(state[2][i % len(state[2])], i % 50, identifier_type='type'),
+             ops=lambda scale: max(10, scale // 100)),
+        Case(f"{prefix}.get_all_products", setup_store, lambda state, i: state[0].get_all_products(),
+             ops=lambda scale: 10),
+    ]
+
+
+def _mathematician_cases() -> list:
+    m = Mathematician()
+    batches = lambda scale: 20
+    return [
+        Case('mathematician.square_nums', lambda scale, rng: make_numbers(scale, rng),
+             lambda nums, i: m.square_nums(nums), batches),
+        Case('mathematician.remove_positives', lambda scale, rng: make_numbers(scale, rng),
+             lambda nums, i: m.remove_positives(nums), batches),
+        Case('mathematician.filter_leaps', lambda scale, rng: make_years(scale, rng),
+             lambda years, i: m.filter_leaps(years), batches),
+    ]
+
+
+def _school_cases() -> list:
+    courses = [f"Course-{i}" for i in range(20)]
+
+    def setup_enroll(scale, rng):
+        return make_students(scale, rng)
+
+    def setup_grade(scale, rng):
+        students = make_students(scale, rng)
+        for student in students:
+            for course in rng.sample(courses, 3):
+                student.enroll_course(course)
+        return Teacher('Teacher', 40, 'Жінка', 'T1', 'Математика', 25000.0), students
+
+    def grade(state, i):
+        teacher, students = state
+        student = students[i % len(students)]
+        teacher.assign_grade(student, student.courses[i % 3], 'Добре')
+
+    return [
+        Case('student.enroll_course', setup_enroll,
+             lambda students, i: students[i % len(students)].enroll_course(courses[i % len(courses)])),
+        Case('teacher.assign_grade', setup_grade, grade),
+    ]
+
+
+CASES = _store_cases(task_3, 'task_3') + _store_cases(task_4, 'task_4') + _mathematician_cases() + _school_cases()
+
+
+# --- Вимірювання ---
+# Операції тривають мікросекунди, тож час вимірюється пакетами з кількох операцій;
+# перцентилі рахуються, лише якщо пакетів щонайменше MIN_SAMPLES
+SAMPLES = 100
+MIN_SAMPLES = 50
+
+
+def run_case(case: Case, scale: int, seed: int) -> dict:
+    """
+    Один запуск сценарію: операції виконуються пакетами (до SAMPLES пакетів), і для кожного
+    пакета вимірюється середня затримка операції. Повертає пропускну здатність і перцентилі
+    затримки (None, якщо пакетів замало для надійного перцентиля).
+    """
+    n_ops = case.ops(scale)
+    batch = max(1, n_ops // SAMPLES)
+
+    state = case.setup(scale, random.Random(seed))
+    op = case.op
+    samples = []
+    clock = time.perf_counter
+    total = 0.0
+    for first in range(0, n_ops, batch):
+        last = min(first + batch, n_ops)
+        start = clock()
+        for i in range(first, last):
+            op(state, i)
+        elapsed = clock() - start
+        total += elapsed
+        samples.append(elapsed / (last - first))
+    del state
+
+    samples.sort()
+    enough = len(samples) >= MIN_SAMPLES
+    pick = lambda p: samples[min(len(samples) - 1, int(len(samples) * p / 100))] * 1e6
+    return {
+        'ops': n_ops,
+        'samples': len(samples),
+        'ops_per_sec': n_ops / total,
+        'p50_us': pick(50),
+        'p95_us': pick(95) if enough else None,
+        'p99_us': pick(99) if enough else None,
+    }
+
+
+def measure_memory(case: Case, scale: int, seed: int) -> int:
+    """
+    Пікова пам'ять сценарію через tracemalloc — окремим запуском, бо tracemalloc
+    суттєво сповільнює код і спотворив би часові показники.
+    """
+    tracemalloc.start()
+    state = case.setup(scale, random.Random(seed))
+    for i in range(case.ops(scale)):
+        case.op(state, i)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del state
+    return peak_memory
+
+
+def _summarize(runs: list, metric: str, higher_is_better: bool) -> tuple:
+    """
+    Повертає (найкраще, «гірше») значення метрики серед запусків. «Гірше» — нижній квартиль
+    (для метрик, де краще менше, — верхній), щоб один випадковий викид не розширював діапазон.
+    """
+    values = sorted(run[metric] for run in runs if run[metric] is not None)
+    if not values:
+        return None, None
+    quartile = len(values) // 4
+    return (values[-1], values[quartile]) if higher_is_better else (values[0], values[-1 - quartile])
+
+
+def run_suite(scale: int, seed: int, repeat: int = 5, selected: list = None) -> dict:
+    """
+    Виконує всі (або вибрані) сценарії; кожен повторюється repeat разів. Для кожної метрики
+    зберігається найкраще та «гірше» значення — діапазон, у якому коливаються вимірювання.
+    """
+    task_4.CustomException.log_sink = None  # помилки в сценаріях не очікуються, журнал лише заважав би
+    cases = [case for case in CASES if not selected or any(pattern in case.name for pattern in selected)]
+    # Повтори чергуються між сценаріями: короткочасне сповільнення машини зачіпає
+    # один запуск багатьох сценаріїв, а не всі запуски одного, і відсіюється вибором найкращого
+    all_runs = {case.name: [] for case in cases}
+    for _ in range(repeat):
+        for case in cases:
+            all_runs[case.name].append(run_case(case, scale, seed))
+
+    results = {}
+    for case in cases:
+        runs = all_runs[case.name]
+        result = {'ops': runs[0]['ops'], 'samples': runs[0]['samples']}
+        for metric in ('ops_per_sec', 'p50_us', 'p95_us', 'p99_us'):
+            result[metric], result[metric + '_worst'] = _summarize(runs, metric, metric == 'ops_per_sec')
+        result['peak_memory_bytes'] = measure_memory(case, scale, seed)
+        results[case.name] = result
+        print_result(case.name, result)
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'scale': scale,
+            'seed': seed,
+            'repeat': repeat,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+def print_result(name: str, result: dict):
+    p99 = f"{result['p99_us']:>9.2f} мкс" if result['p99_us'] is not None else f"{'—':>13}"
+    print(f"{name:<32} {result['ops_per_sec']:>14,.0f} оп/с (гірший {result['ops_per_sec_worst']:>12,.0f})  "
+          f"p50 {result['p50_us']:>9.2f} мкс  p99 {p99}  пам'ять {result['peak_memory_bytes'] / 2 ** 20:>8.2f} МБ")
+
+
+def compare(current: dict, previous: dict, threshold: float) -> list:
+    """
+    Порівнює поточний запуск з попереднім і повертає список регресій: падіння пропускної
+    здатності або зростання пам'яті більше ніж на threshold (частка, 0.1 = 10%).
+    p99 до перевірки не входить: навіть із пакетним вимірюванням він надто шумний для
+    автоматичного порогу і лишається у звіті для ручного аналізу.
+    Для пропускної здатності регресією вважається лише випадок, коли діапазони запусків не
+    перетинаються: найкращий поточний результат гірший за «гірший» попередній більше ніж
+    на threshold. Інакше зміну не відрізнити від коливань вимірювань.
+    """
+    if current['meta']['scale'] != previous['meta']['scale']:
+        print(f"Увага: масштаб відрізняється ({previous['meta']['scale']} -> {current['meta']['scale']}), "
+              f"порівняння неточне.")
+
+    regressions = []
+    for name, result in current['results'].items():
+        old = previous['results'].get(name)
+        if old is None:
+            continue
+        for metric, higher_is_better in (('ops_per_sec', True), ('peak_memory_bytes', False)):
+            new_best, old_best = result.get(metric), old.get(metric)
+            if not new_best or not old_best:
+                continue
+            old_worst = old.get(metric + '_worst', old_best)
+            if higher_is_better:
+                regressed = new_best < old_worst * (1 - threshold)
+                change = (old_best - new_best) / old_best
+            else:
+                regressed = new_best > old_worst * (1 + threshold)
+                change = (new_best - old_best) / old_best
+            if regressed:
+                regressions.append((name, metric, old_best, new_best, change))
+    return regressions
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарки ProductStore, Mathematician та шкільної моделі.")
+    parser.add_argument('--scale', type=int, default=10_000, help="розмір синтетичних даних")
+    parser.add_argument('--seed', type=int, default=42, help="зерно генератора даних")
+    parser.add_argument('--repeat', type=int, default=5, help="кількість повторів кожного сценарію")
+    parser.add_argument('--output', default='bench_results.json', help="файл для результатів (JSON)")
+    parser.add_argument('--compare', help="JSON попереднього запуску для пошуку регресій")
+    parser.add_argument('--threshold', type=float, default=0.10, help="допустиме погіршення (0.10 = 10%%)")
+    parser.add_argument('--cases', nargs='*', help="запускати лише сценарії, назва яких містить ці рядки")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.scale, args.seed, args.repeat, args.cases)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\nРезультати записано у '{args.output}'.")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            previous = json.load(f)
+        regressions = compare(report, previous, args.threshold)
+        for name, metric, old, new, change in regressions:
+            print(f"РЕГРЕСІЯ {name} {metric}: {old:,.2f} -> {new:,.2f} (погіршення на {change:.0%})")
+        if regressions:
+            return 1
+        print("Регресій не виявлено.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
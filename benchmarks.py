@@ -0,0 +1,607 @@
+import asyncio
+import contextlib
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from array import array
+
+import task_3
+from async_store import AsyncProductStore
+from columnar_store import ColumnarProductStore
+from concurrent_store import ConcurrentProductStore
+from events import ConsoleSubscriber, CounterSubscriber
+from instrumentation import StoreInstrumentation
+from optional_deps import load_numpy
+from persistent_store import PersistentProductStore
+from sharded_store import ShardedProductStore
+from task_1 import SchoolRegistry, Student, Teacher
+from task_2 import Mathematician, ParallelMathematician
+from task_4 import CustomException, Product, ProductStore
+
+
+# --- Допоміжні функції ---
+def build_store(n_products: int, n_types: int = 100, store_cls=ProductStore):
+    """
+    Створює магазин із n_products синтетичних продуктів, рівномірно розподілених за n_types типами.
+    """
+    store = store_cls()
+    for i in range(n_products):
+        store.add(Product(f"Type-{i % n_types}", f"Product-{i}", 1.0 + i % 50), 100)
+    return store
+
+
+def percentile(values: list, p: float) -> float:
+    """
+    Повертає p-й перцентиль (0-100) списку значень методом найближчого рангу.
+    """
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+
+def timeit(func, repeat: int = 5) -> float:
+    """
+    Повертає найкращий час (у секундах) виконання func серед repeat запусків.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# --- Бенчмарк: set_discount ---
+def _set_discount_full_scan(store: ProductStore, identifier, percent, identifier_type: str = 'name'):
+    """Попередня реалізація set_discount: перебір усього асортименту."""
+    for product_data in store.products.values():
+        product_obj = product_data['product_obj']
+        if identifier_type == 'name' and product_obj.name == identifier:
+            product_data['discount_percent'] = percent
+        elif identifier_type == 'type' and product_obj.type == identifier:
+            product_data['discount_percent'] = percent
+
+
+def bench_set_discount(sizes=(10_000, 100_000, 1_000_000)):
+    """
+    Порівнює повний перебір асортименту з індексованим set_discount (за назвою та за типом).
+    """
+    print("\n--- set_discount: повний перебір vs індекс ---")
+    for n in sizes:
+        store = build_store(n)
+        name = f"Product-{n // 2}"
+        for identifier, identifier_type in ((name, 'name'), ('Type-7', 'type')):
+            old = timeit(lambda: _set_discount_full_scan(store, identifier, 10, identifier_type))
+            new = timeit(lambda: store.set_discount(identifier, 10, identifier_type=identifier_type))
+            print(f"n={n:>9,} {identifier_type:<5} перебір: {old * 1e3:9.3f} мс  "
+                  f"індекс: {new * 1e3:9.3f} мс  прискорення: x{old / new:,.0f}")
+
+
+# --- Бенчмарк: sell_product vs sell_many ---
+def bench_sell_many(n_lines: int = 100_000, n_products: int = 1_000):
+    """
+    Порівнює продаж n_lines рядків замовлень окремими викликами sell_product з одним викликом sell_many.
+    """
+    print("\n--- sell_product у циклі vs sell_many ---")
+    orders = [(f"Product-{i % n_products}", 1) for i in range(n_lines)]
+
+    def per_call():
+        store = build_store(n_products)
+        for product_name, amount in orders:
+            store.sell_product(product_name, amount)
+
+    def batched():
+        store = build_store(n_products)
+        store.sell_many(orders)
+
+    old = timeit(per_call, repeat=3)
+    new = timeit(batched, repeat=3)
+    print(f"рядків={n_lines:>9,} sell_product: {old * 1e3:9.1f} мс  "
+          f"sell_many: {new * 1e3:9.1f} мс  прискорення: x{old / new:.1f}")
+
+
+# --- Бенчмарк: словниковий vs стовпцевий бекенд ---
+def bench_columnar(n_products: int = 200_000):
+    """
+    Порівнює пам'ять на продукт і швидкість масових операцій ProductStore та ColumnarProductStore.
+    """
+    print("\n--- ProductStore vs ColumnarProductStore ---")
+    for store_cls in (ProductStore, ColumnarProductStore):
+        tracemalloc.start()
+        store = build_store(n_products, store_cls=store_cls)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        discount = timeit(lambda: store.set_discount('Type-7', 10, identifier_type='type'))
+        listing = timeit(store.get_all_products, repeat=3)
+        print(f"{store_cls.__name__:<22} пам'ять: {memory / n_products:6.0f} Б/продукт  "
+              f"знижка на тип: {discount * 1e3:7.3f} мс  get_all_products: {listing * 1e3:8.1f} мс")
+
+
+# --- Бенчмарк: __slots__ vs __dict__ ---
+class _DictProduct:
+    """Product без __slots__ (як до переходу на слоти) — точка відліку для порівняння."""
+    def __init__(self, type: str, name: str, price: float):
+        if not isinstance(type, str) or not type:
+            raise ValueError("Тип продукту має бути непорожнім рядком.")
+        if not isinstance(name, str) or not name:
+            raise ValueError("Назва продукту має бути непорожнім рядком.")
+        if not isinstance(price, (int, float)) or price <= 0:
+            raise ValueError("Ціна продукту має бути додатним числом.")
+        self.type = type
+        self.name = name
+        self.price = price
+
+
+class _DictPerson:
+    """Person без __slots__."""
+    def __init__(self, name: str, age: int, gender: str):
+        self.name = name
+        self.age = age
+        self.gender = gender
+        self.events = None
+
+
+class _DictStudent(_DictPerson):
+    """Student без __slots__."""
+    def __init__(self, name: str, age: int, gender: str, student_id: str, grade_level: int):
+        super().__init__(name, age, gender)
+        self.student_id = student_id
+        self.grade_level = grade_level
+        self._courses = {}
+        self.grades = {}
+
+
+class _DictTeacher(_DictPerson):
+    """Teacher без __slots__."""
+    def __init__(self, name: str, age: int, gender: str, employee_id: str, subject: str, salary: float):
+        super().__init__(name, age, gender)
+        self.employee_id = employee_id
+        self.subject = subject
+        self.salary = salary
+        self._classes_taught = {}
+
+
+def _measure_instances(cls, make_args, n: int) -> tuple:
+    """
+    Створює n екземплярів cls і повертає (байт на екземпляр, екземплярів за секунду).
+    Аргументи створюються заздалегідь, тому враховується лише сам об'єкт.
+    """
+    args = [make_args(i) for i in range(n)]
+    tracemalloc.start()
+    start = time.perf_counter()
+    instances = [cls(*a) for a in args]
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return memory / n, n / elapsed
+
+
+def bench_slots(n: int = 200_000):
+    """
+    Порівнює пам'ять на екземпляр і швидкість створення класів зі __slots__ та без них.
+    """
+    print("\n--- __slots__ vs __dict__ ---")
+    product_args = lambda i: ('Sport', f"Product-{i}", 1.0 + i % 50)
+    student_args = lambda i: (f"Student-{i}", 16, 'Жінка', f"S{i}", 10)
+    teacher_args = lambda i: (f"Teacher-{i}", 40, 'Чоловік', f"T{i}", 'Фізика', 25000.0)
+    pairs = (
+        ('Product', _DictProduct, Product, product_args),
+        ('Student', _DictStudent, Student, student_args),
+        ('Teacher', _DictTeacher, Teacher, teacher_args),
+    )
+    for label, before, after, make_args in pairs:
+        old_memory, old_rate = _measure_instances(before, make_args, n)
+        new_memory, new_rate = _measure_instances(after, make_args, n)
+        print(f"{label:<8} __dict__: {old_memory:5.0f} Б, {old_rate:12,.0f} об/с  "
+              f"__slots__: {new_memory:5.0f} Б, {new_rate:12,.0f} об/с")
+
+
+# --- Бенчмарк: багатопотоковий продаж ---
+def bench_concurrent(thread_counts=(1, 2, 4, 8), n_products: int = 1_000, sales_per_thread: int = 50_000):
+    """
+    Стрес-тест ConcurrentProductStore: N потоків одночасно продають товари, яких на складі
+    менше, ніж вони запитують. Перевіряє відсутність перепродажу й точність доходу
+    та виводить пропускну здатність залежно від кількості потоків.
+    """
+    print("\n--- ConcurrentProductStore: масштабування за потоками ---")
+    log_sink, CustomException.log_sink = CustomException.log_sink, None
+    for n_threads in thread_counts:
+        store = ConcurrentProductStore()
+        stock = sales_per_thread * n_threads // n_products // 2  # запасу вистачає лише на половину запитів
+        for i in range(n_products):
+            store.add(Product('Sport', f"Product-{i}", 10), stock)
+        sold = [0] * n_threads
+
+        def worker(index: int):
+            for i in range(sales_per_thread):
+                try:
+                    store.sell_product(f"Product-{(i + index) % n_products}", 1)
+                    sold[index] += 1
+                except CustomException:
+                    pass
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(n_threads)]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+
+        remaining = sum(store.get_product_info(f"Product-{i}")[1] for i in range(n_products))
+        assert sum(sold) == stock * n_products - remaining, "перепродаж"
+        assert all(store.get_product_info(f"Product-{i}")[1] >= 0 for i in range(n_products))
+        assert store.get_income() == sum(sold) * 10 * ProductStore.PRICE_PREMIUM_FACTOR, "втрачено дохід"
+        print(f"потоків={n_threads:<3} продано: {sum(sold):>9,}  "
+              f"пропускна здатність: {sales_per_thread * n_threads / elapsed:12,.0f} оп/с")
+    CustomException.log_sink = log_sink
+
+
+# --- Бенчмарк: асинхронний фасад ---
+def bench_async(n_orders: int = 100_000, concurrency: int = 1_000, n_products: int = 1_000):
+    """
+    Локальний генератор навантаження для AsyncProductStore: concurrency клієнтів
+    одночасно надсилають n_orders замовлень; виводить p50/p99 затримки та замовлень/с.
+    """
+    print("\n--- AsyncProductStore: генератор навантаження ---")
+
+    async def run():
+        latencies = []
+        async with AsyncProductStore(build_store(n_products)) as store:
+            async def client(index: int):
+                for i in range(index, n_orders, concurrency):
+                    start = time.perf_counter()
+                    await store.sell(f"Product-{i % n_products}", 1)
+                    latencies.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            await asyncio.gather(*(client(i) for i in range(concurrency)))
+            elapsed = time.perf_counter() - start
+        return latencies, elapsed
+
+    latencies, elapsed = asyncio.run(run())
+    print(f"замовлень={n_orders:,} клієнтів={concurrency:,}  p50: {percentile(latencies, 50) * 1e3:.2f} мс  "
+          f"p99: {percentile(latencies, 99) * 1e3:.2f} мс  {n_orders / elapsed:,.0f} замовлень/с")
+
+
+# --- Бенчмарк: холодний старт зі знімка ---
+def bench_persistent(n_products: int = 200_000):
+    """
+    Порівнює відновлення каталогу зі знімка (mmap) з повторним додаванням усіх продуктів через add.
+    """
+    print("\n--- PersistentProductStore: холодний старт ---")
+    with tempfile.TemporaryDirectory() as directory:
+        with PersistentProductStore(directory, group_commit=10_000) as store:
+            rebuild = timeit(lambda: build_store(n_products, store_cls=ColumnarProductStore), repeat=1)
+            for i in range(n_products):
+                store.add(Product(f"Type-{i % 100}", f"Product-{i}", 1.0 + i % 50), 100)
+            store.checkpoint()
+
+        cold_start = timeit(lambda: PersistentProductStore(directory).close(), repeat=3)
+    print(f"n={n_products:,}  перебудова через add: {rebuild * 1e3:8.1f} мс  "
+          f"завантаження знімка: {cold_start * 1e3:8.1f} мс")
+
+
+# --- Бенчмарк: Mathematician, списки vs масиви ---
+def bench_mathematician(sizes=(1_000, 100_000, 1_000_000)):
+    """
+    Порівнює шлях зі списками Python і векторний шлях (array.array через NumPy) для методів Mathematician.
+    """
+    print("\n--- Mathematician: list vs array.array ---")
+    if load_numpy() is None:
+        print("NumPy не встановлено: array.array обробляється поелементно, прискорення не очікується.")
+    m = Mathematician()
+    for n in sizes:
+        values = [(i * 7919) % 4001 - 2000 for i in range(n)]
+        vector = array('q', values)
+        for method in (m.square_nums, m.remove_positives, m.filter_leaps):
+            old = timeit(lambda: method(values), repeat=3)
+            new = timeit(lambda: method(vector), repeat=3)
+            print(f"n={n:>9,} {method.__name__:<17} list: {old * 1e3:9.2f} мс  "
+                  f"array: {new * 1e3:9.2f} мс  прискорення: x{old / new:.1f}")
+
+
+# --- Бенчмарк: ParallelMathematician ---
+def bench_parallel(n: int = 5_000_000, chunk_size: int = 500_000, max_workers: int = None):
+    """
+    Вимірює масштабування ParallelMathematician.filter_leaps від 1 до max_workers процесів
+    для array.array (спільна пам'ять) та генератора (потокова обробка).
+    """
+    print("\n--- ParallelMathematician: масштабування за процесами ---")
+    max_workers = max_workers or os.cpu_count() or 1
+    years = array('q', ((i * 7919) % 800 + 1600 for i in range(n)))
+    baseline = timeit(lambda: Mathematician().filter_leaps(years), repeat=1)
+    print(f"n={n:,} один процес без пулу: {baseline * 1e3:.0f} мс")
+    for workers in sorted({1, 2, 4, 8, max_workers}):
+        if workers > max_workers:
+            continue
+        with ParallelMathematician(workers=workers, chunk_size=chunk_size) as pm:
+            pm.filter_leaps(years)  # прогрів пулу
+            shared = timeit(lambda: pm.filter_leaps(years), repeat=1)
+            streamed = timeit(lambda: sum(1 for _ in pm.filter_leaps(iter(years))), repeat=1)
+        print(f"процесів={workers:<3} array: {shared * 1e3:8.0f} мс  генератор: {streamed * 1e3:8.0f} мс  "
+              f"прискорення (array): x{baseline / shared:.1f}")
+
+
+# --- Бенчмарк: таблиця високосних років ---
+def bench_leap_table(n: int = 1_000_000):
+    """
+    Порівнює арифметичну перевірку високосних років із таблицею на реалістичному
+    розподілі: більшість років повторюється в діапазоні 1950-2030, невелика частка — поза ним.
+    """
+    print("\n--- filter_leaps: арифметика vs таблиця ---")
+    rng = random.Random(42)
+    years = [rng.randint(1950, 2030) if rng.random() < 0.98 else rng.randint(1, 3000) for _ in range(n)]
+    plain = Mathematician()
+    table = Mathematician(leap_years_range=(1900, 2100))
+    for label, func in (
+        ('filter_leaps', lambda m: m.filter_leaps(years)),
+        ('iter_leaps', lambda m: sum(1 for _ in m.iter_leaps(years))),
+    ):
+        old = timeit(lambda: func(plain), repeat=3)
+        new = timeit(lambda: func(table), repeat=3)
+        print(f"n={n:,} {label:<13} арифметика: {old * 1e3:8.1f} мс  таблиця: {new * 1e3:8.1f} мс  "
+              f"прискорення: x{old / new:.2f}")
+
+
+# --- Бенчмарк: реєстр школи ---
+def bench_school_registry(n_students: int = 500_000, courses_per_student: int = 5, n_courses: int = 200):
+    """
+    Вимірює пакетний запис на курси, виставлення оцінок і звіти GradeBook через SchoolRegistry для n_students учнів.
+    """
+    print("\n--- SchoolRegistry: пакетні операції ---")
+    registry = SchoolRegistry()
+    registry.add_teacher(Teacher("Teacher", 40, 'Жінка', 'T1', 'Математика', 25000.0))
+
+    start = time.perf_counter()
+    for i in range(n_students):
+        registry.add_student(Student(f"Student-{i}", 16, 'Жінка', f"S{i}", 1 + i % 11))
+    added = time.perf_counter() - start
+
+    enrollments = [(f"S{i}", f"Course-{(i + k) % n_courses}") for i in range(n_students) for k in range(courses_per_student)]
+    start = time.perf_counter()
+    registry.enroll_many(enrollments)
+    enrolled = time.perf_counter() - start
+
+    grades = [(student_id, course, 'Добре') for student_id, course in enrollments]
+    start = time.perf_counter()
+    registry.assign_grades('T1', grades)
+    graded = time.perf_counter() - start
+
+    start = time.perf_counter()
+    in_course = len(registry.students_in_course('Course-7'))
+    lookup = time.perf_counter() - start
+    print(f"учнів={n_students:,} додавання: {added:.2f} с  запис ({len(enrollments):,}): {enrolled:.2f} с  "
+          f"оцінки: {graded:.2f} с  учні курсу ({in_course:,}): {lookup * 1e3:.1f} мс")
+
+    gradebook = registry.gradebook
+    start = time.perf_counter()
+    gradebook.averages_by_course()
+    gradebook.grade_level_distribution(10)
+    gradebook.ranking(top=100)
+    reports = time.perf_counter() - start
+    print(f"звіти GradeBook (середні за курсами, розподіл класу, рейтинг): {reports:.2f} с")
+
+
+# --- Бенчмарк: виведення результатів операцій ---
+def bench_events(n_ops: int = 200_000):
+    """
+    Порівнює швидкість операцій task_3.ProductStore без підписників (тихий режим),
+    з лічильником подій та з виведенням у консоль (як print() раніше; вивід іде в /dev/null).
+    """
+    print("\n--- ProductStore (task_3): тихий режим vs виведення ---")
+    subscribers = (('тихо', None), ('лічильник', CounterSubscriber()), ('консоль', ConsoleSubscriber()))
+    for label, subscriber in subscribers:
+        store = task_3.ProductStore()
+        store.add(task_3.Product('Food', 'Ramen', 1.5), n_ops)
+        if subscriber is not None:
+            store.events.subscribe(subscriber)
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            for _ in range(n_ops):
+                store.sell_product('Ramen', 1)
+            elapsed = time.perf_counter() - start
+        print(f"{label:<10} {n_ops / elapsed:12,.0f} оп/с")
+
+
+# --- Бенчмарк: накладні витрати інструментування ---
+def bench_instrumentation(n_ops: int = 200_000):
+    """Порівнює sell_product (task_4) без інструментування, з ним і після detach()."""
+    print("\n--- ProductStore (task_4): накладні витрати інструментування ---")
+    store = ProductStore()
+    store.add(Product('Food', 'Ramen', 1.5), 3 * n_ops)
+    instrumentation = StoreInstrumentation()
+
+    def run(label: str):
+        start = time.perf_counter()
+        for _ in range(n_ops):
+            store.sell_product('Ramen', 1)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<22} {n_ops / elapsed:12,.0f} оп/с")
+
+    run('без інструментування')
+    instrumentation.attach(store)
+    run('з інструментуванням')
+    instrumentation.detach(store)
+    run('після detach()')
+
+
+# --- Бенчмарк: масове завантаження каталогу ---
+def bench_bulk_load(n_products: int = 1_000_000, n_types: int = 100):
+    """Порівнює завантаження каталогу через add() по рядку та через from_records (з перевіркою і без)."""
+    print(f"\n--- ProductStore (task_4): завантаження {n_products:,} продуктів ---")
+    records = [(f"Type-{i % n_types}", f"Product-{i}", 1.0 + i % 500, 100) for i in range(n_products)]
+
+    def load_with_add():
+        store = ProductStore()
+        for product_type, name, price, amount in records:
+            store.add(Product(product_type, name, price), amount)
+        return store
+
+    variants = (
+        ('add() по рядку', load_with_add),
+        ("from_records('schema')", lambda: ProductStore.from_records(records)),
+        ("from_records('none')", lambda: ProductStore.from_records(records, validate='none')),
+    )
+    for label, load in variants:
+        elapsed = timeit(load, repeat=3)
+        print(f"{label:<24} {elapsed:8.3f} с  ({n_products / elapsed:12,.0f} рядків/с)")
+
+
+# --- Бенчмарк: шардований магазин ---
+def bench_sharded(shard_counts=(1, 2, 4, 8), n_orders: int = 1_000_000, batch_size: int = 50_000,
+                  n_products: int = 10_000):
+    """
+    Пропускна здатність ShardedProductStore.sell_batch залежно від кількості процесів-шардів
+    (порівняно з одним ProductStore у поточному процесі). Масштабування обмежене кількістю ядер.
+    """
+    print(f"\n--- ShardedProductStore: масштабування за процесами (ядер: {os.cpu_count()}) ---")
+    orders = [(f"Product-{i % n_products}", 1) for i in range(n_orders)]
+    batches = [orders[i:i + batch_size] for i in range(0, n_orders, batch_size)]
+    stock = n_orders // n_products
+
+    store = ProductStore()
+    for i in range(n_products):
+        store.add(Product('Sport', f"Product-{i}", 10), stock)
+    start = time.perf_counter()
+    for name, amount in orders:
+        store.sell_product(name, amount)
+    print(f"{'один процес':<14} {n_orders / (time.perf_counter() - start):12,.0f} оп/с")
+
+    for shards in shard_counts:
+        with ShardedProductStore(shards) as sharded:
+            for i in range(n_products):
+                sharded.add(Product('Sport', f"Product-{i}", 10), stock)
+            start = time.perf_counter()
+            for batch in batches:
+                errors = sharded.sell_batch(batch)
+            elapsed = time.perf_counter() - start
+            assert not any(errors)
+            assert round(sharded.get_income(), 2) == round(store.get_income(), 2)
+        print(f"шардів={shards:<7} {n_orders / elapsed:12,.0f} оп/с")
+
+
+# --- Бенчмарк: кампанії знижок ---
+def bench_campaigns(n_products: int = 100_000, campaign_counts=(0, 1_000, 10_000), n_sales: int = 200_000):
+    """
+    Швидкість sell_product (task_4) залежно від кількості одночасних кампаній знижок:
+    половина кампаній діє на окремі продукти, половина — на типи; частина вже закінчилася.
+    """
+    print(f"\n--- ProductStore (task_4): продажі за активних кампаній ({n_products:,} продуктів) ---")
+    rng = random.Random(0)
+    names = [f"Product-{i}" for i in range(n_products)]
+    for n_campaigns in campaign_counts:
+        store = build_store(n_products)
+        for product_data in store.products.values():
+            product_data['amount'] = n_sales
+        now = time.time()
+        for i in range(n_campaigns):
+            start = now - rng.uniform(0, 3600)
+            end = start + rng.uniform(60, 7200)
+            if i % 2:
+                store.add_campaign(rng.choice(names), rng.randint(1, 50), start, end, priority=rng.randint(0, 3))
+            else:
+                store.add_campaign(f"Type-{rng.randrange(100)}", rng.randint(1, 50), start, end,
+                                   identifier_type='type', priority=rng.randint(0, 3))
+        start = time.perf_counter()
+        for i in range(n_sales):
+            store.sell_product(names[i % n_products], 1)
+        elapsed = time.perf_counter() - start
+        print(f"кампаній={n_campaigns:<8} {n_sales / elapsed:12,.0f} оп/с")
+
+
+# --- Бенчмарк: точний облік доходу ---
+def bench_accounting(n_sales: int = 500_000, n_products: int = 1_000):
+    """Порівнює sell_product (task_4) з обліком доходу у float та в цілих копійках."""
+    print("\n--- ProductStore (task_4): облік доходу float vs копійки ---")
+    names = [f"Product-{i}" for i in range(n_products)]
+    for accounting in ('float', 'cents'):
+        store = ProductStore(accounting=accounting)
+        for i, name in enumerate(names):
+            store.add(Product(f"Type-{i % 10}", name, 0.1 + i % 50), n_sales)
+        start = time.perf_counter()
+        for i in range(n_sales):
+            store.sell_product(names[i % n_products], 1)
+        elapsed = time.perf_counter() - start
+        total = store.get_income_exact() if accounting == 'cents' else repr(store.get_income())
+        print(f"{accounting:<6} {n_sales / elapsed:12,.0f} оп/с  дохід: {total}")
+
+
+# --- Бенчмарк: залишки та лідери продажів ---
+def bench_stock_tracking(n_products: int = 200_000, n_sales: int = 200_000, k: int = 20):
+    """
+    Порівнює запити «найменші залишки» і «лідери продажів» через get_all_products() + сортування
+    з інкрементними індексами track_stock, а також вартість їх оновлення в sell_product.
+    """
+    print(f"\n--- ProductStore (task_4): залишки та лідери продажів ({n_products:,} продуктів) ---")
+    rng = random.Random(0)
+    names = [f"Product-{i}" for i in range(n_products)]
+    sales = [(rng.choice(names), rng.randint(1, 3)) for _ in range(n_sales)]
+
+    for tracked in (False, True):
+        store = build_store(n_products)
+        if tracked:
+            store.track_stock(reorder_level=10)
+        start = time.perf_counter()
+        for name, amount in sales:
+            try:
+                store.sell_product(name, amount)
+            except CustomException:
+                pass
+        elapsed = time.perf_counter() - start
+        print(f"sell_product, {'з індексами' if tracked else 'без індексів':<12} {n_sales / elapsed:12,.0f} оп/с")
+
+    log_sink, CustomException.log_sink = CustomException.log_sink, None
+    full_sort = timeit(lambda: sorted(store.get_all_products(), key=lambda row: row['amount'])[:k])
+    low_stock = timeit(lambda: store.low_stock(92))
+    top_sellers = timeit(lambda: store.top_sellers(k))
+    CustomException.log_sink = log_sink
+    print(f"get_all_products + sort: {full_sort * 1e3:9.3f} мс")
+    print(f"low_stock(92):           {low_stock * 1e3:9.3f} мс  ({len(store.low_stock(92))} продуктів)")
+    print(f"top_sellers({k}):         {top_sellers * 1e3:9.3f} мс")
+
+
+# --- Бенчмарк: час імпорту ---
+def bench_import_time(modules=('task_1', 'task_2', 'task_3', 'task_4', 'columnar_store', 'events')):
+    """
+    Запускає `python -X importtime` для кожного модуля в окремому процесі й виводить
+    власний та сукупний час імпорту (включно із залежностями, яких ще немає в інтерпретаторі).
+    """
+    print("\n--- Час імпорту (python -X importtime) ---")
+    for module in modules:
+        completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                                   capture_output=True, text=True, check=True)
+        for line in completed.stderr.splitlines():
+            _, self_us, cumulative_us, name = (part.strip() for part in line.replace(':', '|', 1).split('|'))
+            if name == module:
+                print(f"{module:<16} власний: {int(self_us) / 1e3:6.2f} мс  сукупний: {int(cumulative_us) / 1e3:6.2f} мс")
+
+
+if __name__ == "__main__":
+    # Розміри каталогу можна передати аргументами: python benchmarks.py 10000 100000
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or (10_000, 100_000, 1_000_000)
+    bench_set_discount(sizes)
+    bench_sell_many()
+    bench_columnar()
+    bench_slots()
+    bench_concurrent()
+    bench_async()
+    bench_persistent()
+    bench_mathematician()
+    bench_parallel()
+    bench_leap_table()
+    bench_school_registry()
+    bench_events()
+    bench_instrumentation()
+    bench_bulk_load()
+    bench_sharded()
+    bench_campaigns()
+    bench_accounting()
+    bench_stock_tracking()
+    bench_import_time()
@@ -0,0 +1,98 @@
+import heapq
+import time
+
+
+# --- Кампанія знижок ---
+class Campaign:
+    """
+    Тимчасова знижка percent% для продукту (identifier_type='name') або типу продуктів
+    (identifier_type='type'), що діє з моменту start (включно) до end (не включно).
+    """
+    __slots__ = ('identifier', 'identifier_type', 'percent', 'start', 'end', 'priority', 'seq', 'cancelled')
+
+    def __init__(self, identifier, identifier_type: str, percent: float, start: float, end: float,
+                 priority: int, seq: int):
+        self.identifier = identifier
+        self.identifier_type = identifier_type
+        self.percent = percent
+        self.start = start
+        self.end = end
+        self.priority = priority
+        self.seq = seq
+        self.cancelled = False
+
+    def __repr__(self):
+        return (f"Campaign({self.identifier_type}='{self.identifier}', percent={self.percent}, "
+                f"start={self.start}, end={self.end}, priority={self.priority})")
+
+
+# --- Розклад кампаній ---
+class CampaignSchedule:
+    """
+    Розклад кампаній знижок, що не потребує перебору асортименту.
+    - Заплановані кампанії лежать у купі за часом початку й переходять до активних лише тоді,
+      коли під час читання ціни настає їхній час.
+    - Активні кампанії зберігаються окремою купою для кожної цілі (назви чи типу), упорядкованою
+      за пріоритетом; завершені й скасовані кампанії видаляються з вершини купи під час читання.
+    Тож пошук знижки для продукту коштує O(log n) (амортизовано) навіть за тисяч кампаній.
+
+    Якщо для продукту діє кілька кампаній, перемагає та, у якої:
+    1) вищий priority; 2) за рівного пріоритету — кампанія на назву, а не на тип;
+    3) далі — пізніше додана.
+    """
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self._pending = []  # (start, seq, campaign)
+        self._active = {}  # (identifier_type, identifier) -> купа (-priority, -seq, campaign)
+        self._seq = 0
+
+    def __bool__(self):
+        return bool(self._pending or self._active)
+
+    def add(self, identifier, identifier_type: str, percent: float, start: float, end: float,
+            priority: int = 0) -> Campaign:
+        self._seq += 1
+        campaign = Campaign(identifier, identifier_type, percent, start, end, priority, self._seq)
+        heapq.heappush(self._pending, (start, campaign.seq, campaign))
+        return campaign
+
+    def cancel(self, campaign: Campaign):
+        # Кампанія видаляється з куп ліниво, коли опиниться на вершині
+        campaign.cancelled = True
+
+    def percent_for(self, product_name: str, product_type: str):
+        """Повертає відсоток знижки кампанії, що зараз діє для продукту, або None."""
+        now = self.clock()
+        self._activate(now)
+        if not self._active:
+            return None
+
+        best = None
+        for key, rank in ((('name', product_name), 1), (('type', product_type), 0)):
+            campaign = self._top(key, now)
+            if campaign is not None:
+                candidate = (campaign.priority, rank, campaign.seq, campaign)
+                if best is None or candidate[:3] > best[:3]:
+                    best = candidate
+        return None if best is None else best[3].percent
+
+    def _activate(self, now: float):
+        pending = self._pending
+        while pending and pending[0][0] <= now:
+            _, _, campaign = heapq.heappop(pending)
+            if campaign.cancelled or campaign.end <= now:
+                continue
+            heap = self._active.setdefault((campaign.identifier_type, campaign.identifier), [])
+            heapq.heappush(heap, (-campaign.priority, -campaign.seq, campaign))
+
+    def _top(self, key: tuple, now: float):
+        heap = self._active.get(key)
+        if heap is None:
+            return None
+        while heap:
+            campaign = heap[0][2]
+            if not campaign.cancelled and campaign.end > now:
+                return campaign
+            heapq.heappop(heap)
+        del self._active[key]
+        return None
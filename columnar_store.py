@@ -0,0 +1,179 @@
+from array import array
+
+from optional_deps import load_numpy
+from task_4 import CustomException, Product
+
+
+# --- Клас ColumnarProductStore ---
+class ColumnarProductStore:
+    """
+    Альтернативний бекенд ProductStore, що зберігає асортимент по стовпцях.
+    Базові ціни, кількості, знижки та типи лежать у суцільних масивах (модуль array),
+    а назва продукту відображається в номер рядка. Об'єкти Product не зберігаються.
+    Якщо встановлено NumPy, масові операції виконуються векторно над тими ж буферами.
+    """
+    PRICE_PREMIUM_FACTOR = 1.30
+
+    def __init__(self):
+        self.income = 0.0
+        self._rows = {}              # назва продукту -> номер рядка
+        self._names = []             # номер рядка -> назва продукту
+        self._types = []             # код типу -> назва типу
+        self._type_codes = {}        # назва типу -> код типу
+        self._rows_by_type = {}      # код типу -> масив номерів рядків
+        self._prices = array('d')    # базові ціни
+        self._amounts = array('q')   # кількість на складі
+        self._discounts = array('d') # знижки у відсотках
+        self._type_ids = array('q')  # код типу для кожного рядка
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, product: Product, amount: int):
+        if not isinstance(product, Product):
+            raise CustomException("Додавати можна лише об'єкти класу Product.")
+        if not isinstance(amount, int) or amount <= 0:
+            raise CustomException("Кількість продукту має бути додатним цілим числом.")
+
+        row = self._rows.get(product.name)
+        if row is not None:
+            self._amounts[row] += amount
+            return
+
+        type_code = self._type_codes.get(product.type)
+        if type_code is None:
+            type_code = len(self._types)
+            self._type_codes[product.type] = type_code
+            self._types.append(product.type)
+            self._rows_by_type[type_code] = array('q')
+
+        row = len(self._names)
+        self._rows[product.name] = row
+        self._names.append(product.name)
+        self._prices.append(product.price)
+        self._amounts.append(amount)
+        self._discounts.append(0.0)
+        self._type_ids.append(type_code)
+        self._rows_by_type[type_code].append(row)
+
+    def set_discount(self, identifier: str | int, percent: int | float, identifier_type: str = 'name'):
+        if not (0 <= percent <= 100):
+            raise CustomException("Відсоток знижки має бути від 0 до 100.")
+        if identifier_type not in ['name', 'type']:
+            raise CustomException("identifier_type має бути 'name' або 'type'.")
+
+        if identifier_type == 'name':
+            row = self._rows.get(identifier)
+            if row is not None:
+                self._discounts[row] = percent
+                return
+        else:
+            type_code = self._type_codes.get(identifier)
+            if type_code is not None:
+                rows = self._rows_by_type[type_code]
+                np = load_numpy()
+                if np is not None:
+                    np.frombuffer(self._discounts, dtype=np.float64)[np.frombuffer(rows, dtype=np.int64)] = percent
+                else:
+                    for row in rows:
+                        self._discounts[row] = percent
+                return
+
+        raise CustomException(f"Продукт(и) з ідентифікатором '{identifier}' (тип: {identifier_type}) не знайдено.")
+
+    def sell_product(self, product_name: str, amount: int):
+        if not isinstance(product_name, str) or not product_name:
+            raise CustomException("Назва продукту має бути непорожнім рядком.")
+        if not isinstance(amount, int) or amount <= 0:
+            raise CustomException("Кількість для продажу має бути додатним цілим числом.")
+
+        row = self._rows.get(product_name)
+        if row is None:
+            raise CustomException(f"Продукту '{product_name}' немає в наявності.")
+
+        current_amount = self._amounts[row]
+        if current_amount < amount:
+            raise CustomException(f"Недостатньо '{product_name}' на складі. Доступно: {current_amount}, запитано: {amount}.")
+
+        self._amounts[row] = current_amount - amount
+        self.income += self._unit_price(row) * amount
+
+    def _unit_price(self, row: int) -> float:
+        price_after_premium = self._prices[row] * self.PRICE_PREMIUM_FACTOR
+        return price_after_premium * (1 - self._discounts[row] / 100)
+
+    def _unit_prices(self):
+        """
+        Повертає кінцеві ціни за одиницю для всіх рядків
+        (масив NumPy, якщо він доступний, інакше список).
+        """
+        np = load_numpy()
+        if np is not None:
+            prices = np.frombuffer(self._prices, dtype=np.float64)
+            discounts = np.frombuffer(self._discounts, dtype=np.float64)
+            return prices * self.PRICE_PREMIUM_FACTOR * (1 - discounts / 100)
+        return [self._unit_price(row) for row in range(len(self._names))]
+
+    def get_income(self) -> float:
+        return self.income
+
+    def get_stock_value(self) -> float:
+        """
+        Повертає вартість усього складу за поточними цінами (з націнкою та знижкою).
+        """
+        np = load_numpy()
+        if np is not None:
+            amounts = np.frombuffer(self._amounts, dtype=np.int64)
+            return float(np.dot(self._unit_prices(), amounts))
+        return sum(price * amount for price, amount in zip(self._unit_prices(), self._amounts))
+
+    def get_all_products(self) -> list:
+        unit_prices = self._unit_prices()
+        if not isinstance(unit_prices, list):
+            unit_prices = unit_prices.tolist()
+        # Вбудований round(), як у ProductStore: np.round округлює деякі ціни інакше на копійку
+        unit_prices = [round(price, 2) for price in unit_prices]
+
+        types = self._types
+        return [
+            {
+                'name': name,
+                'type': types[type_code],
+                'amount': amount,
+                'unit_price_with_premium_and_discount': unit_price
+            }
+            for name, type_code, amount, unit_price in zip(self._names, self._type_ids, self._amounts, unit_prices)
+        ]
+
+    def get_product_info(self, product_name: str) -> tuple:
+        row = self._rows.get(product_name)
+        if row is None:
+            raise CustomException(f"Продукту '{product_name}' немає в наявності.")
+        return (product_name, self._amounts[row])
+
+
+# --- ТЕСТУВАННЯ: має бути поза класами ---
+if __name__ == "__main__":
+    print("\n--- Тестування ColumnarProductStore ---")
+
+    s = ColumnarProductStore()
+    s.add(Product('Sport', 'Football T-Shirt', 100), 10)
+    s.add(Product('Food', 'Ramen', 1.5), 300)
+    s.add(Product('Sport', 'Basketball', 50), 5)
+
+    s.sell_product('Ramen', 10)
+    assert s.get_product_info('Ramen') == ('Ramen', 290)
+    print("✅ Продаж успішний. Дані актуальні.")
+
+    s.set_discount('Sport', 20, identifier_type='type')
+    s.sell_product('Football T-Shirt', 5)
+    assert round(s.get_income(), 2) == 539.50
+    assert s.get_all_products()[2]['unit_price_with_premium_and_discount'] == 52.0
+    print(f"✅ Знижка на категорію застосована. Вартість складу: {s.get_stock_value():.2f}")
+
+    # Ціни в асортименті округлюються так само, як у ProductStore, з NumPy і без нього
+    s.add(Product('Food', 'Mochi', 2.5), 1)
+    s.set_discount('Mochi', 10)
+    assert s.get_all_products()[3]['unit_price_with_premium_and_discount'] == round(2.5 * 1.3 * 0.9, 2) == 2.93
+
+    print("\nВсі тести пройшли успішно!")
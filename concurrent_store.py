@@ -0,0 +1,220 @@
+import contextlib
+import threading
+
+from money import cents_to_decimal
+from task_4 import CustomException, Product, ProductStore
+
+
+# --- Клас ConcurrentProductStore ---
+class ConcurrentProductStore(ProductStore):
+    """
+    Потокобезпечний ProductStore для багатопотокових кас.
+    Замість одного глобального замка використовується набір замків (stripes):
+    продукт захищається замком з номером hash(назва) % stripes, тож продажі різних
+    продуктів здебільшого не конкурують між собою.
+    Дохід (і точний дохід у копійках) накопичується окремо в кожному потоці й підсумовується
+    лише під час читання. Спільний замок розкладу кампаній береться лише для звернення
+    до розкладу, коли кампанії є; звичайні продажі його не торкаються.
+    iter_products, get_products_page та export_products не потребують замка: вони йдуть
+    за списком назв, що лише доповнюється, тож паралельні add їх не порушують.
+    """
+    def __init__(self, stripes: int = 64, accounting: str = 'float'):
+        super().__init__(accounting)
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        # Захищає зміну структури каталогу (нові продукти) та обхід усього асортименту
+        self._catalog_lock = threading.Lock()
+        self._income_cells = []
+        self._local = threading.local()
+        # Розклад кампаній змінюється під час читання цін з будь-якого набору замків
+        self._campaign_lock = threading.Lock()
+        # Лічильники точного доходу (accounting='cents') потоків: [копійки, за продуктами, за типами]
+        self._revenue_cells = []
+        self._stock_lock = threading.Lock()
+
+    def _stripe(self, product_name) -> int:
+        return hash(product_name) % len(self._locks) if isinstance(product_name, str) else 0
+
+    def _add_income(self, value: float):
+        cell = getattr(self._local, 'income', None)
+        if cell is None:
+            cell = self._local.income = [0.0]
+            with self._catalog_lock:
+                self._income_cells.append(cell)
+        cell[0] += value
+
+    def get_income(self) -> float:
+        return self.income + sum(cell[0] for cell in self._income_cells)
+
+    def _add_revenue(self, product_name: str, cents: int):
+        cell = getattr(self._local, 'revenue', None)
+        if cell is None:
+            cell = self._local.revenue = [0, {}, {}]
+            with self._catalog_lock:
+                self._revenue_cells.append(cell)
+        cell[0] += cents
+        by_product, by_type = cell[1], cell[2]
+        by_product[product_name] = by_product.get(product_name, 0) + cents
+        product_type = self.products[product_name]['product_obj'].type
+        by_type[product_type] = by_type.get(product_type, 0) + cents
+
+    def get_income_exact(self) -> 'Decimal':
+        self._require_cents()
+        return cents_to_decimal(self.income_cents + sum(cell[0] for cell in self._revenue_cells))
+
+    def get_revenue(self, identifier: str, identifier_type: str = 'name') -> 'Decimal':
+        total = super().get_revenue(identifier, identifier_type)
+        index = 1 if identifier_type == 'name' else 2
+        return total + cents_to_decimal(sum(cell[index].get(identifier, 0) for cell in self._revenue_cells))
+
+    def get_revenue_by_type(self) -> dict:
+        self._require_cents()
+        totals = dict(self._revenue_by_type)
+        for cell in self._revenue_cells:
+            for product_type, cents in cell[2].copy().items():  # copy() — знімок, поки потік-власник пише
+                totals[product_type] = totals.get(product_type, 0) + cents
+        return {product_type: cents_to_decimal(cents) for product_type, cents in totals.items()}
+
+    def _stock_changed(self, product_name: str, amount: int, sold: int):
+        with self._stock_lock:
+            super()._stock_changed(product_name, amount, sold)
+
+    def low_stock(self, threshold: int) -> list:
+        with self._stock_lock:
+            return super().low_stock(threshold)
+
+    def top_sellers(self, k: int = 10) -> list:
+        with self._stock_lock:
+            return super().top_sellers(k)
+
+    def add(self, product: Product, amount: int):
+        with self._locks[self._stripe(getattr(product, 'name', None))]:
+            if isinstance(product, Product) and product.name not in self.products:
+                with self._catalog_lock:
+                    super().add(product, amount)
+            else:
+                super().add(product, amount)
+
+    def sell_product(self, product_name: str, amount: int):
+        with self._locks[self._stripe(product_name)]:
+            super().sell_product(product_name, amount)
+
+    def sell_many(self, orders) -> list:
+        if isinstance(orders, dict):
+            orders = orders.items()
+        lines = list(orders)
+
+        # Замки беремо у зростаючому порядку номерів, щоб уникнути взаємного блокування
+        stripes = sorted({self._stripe(line[0]) for line in lines})
+        for stripe in stripes:
+            self._locks[stripe].acquire()
+        try:
+            return super().sell_many(lines)
+        finally:
+            for stripe in reversed(stripes):
+                self._locks[stripe].release()
+
+    def set_discount(self, identifier, percent, identifier_type: str = 'name'):
+        if identifier_type == 'name':
+            with self._locks[self._stripe(identifier)]:
+                return super().set_discount(identifier, percent, identifier_type)
+        # Знижка на тип зачіпає багато продуктів: беремо всі замки, як при зміні націнки
+        with self._all_locks():
+            return super().set_discount(identifier, percent, identifier_type)
+
+    def set_premium_factor(self, factor: float):
+        with self._all_locks():
+            super().set_premium_factor(factor)
+
+    def add_campaign(self, *args, **kwargs):
+        with self._campaign_lock:
+            return super().add_campaign(*args, **kwargs)
+
+    def cancel_campaign(self, campaign):
+        with self._campaign_lock:
+            super().cancel_campaign(campaign)
+
+    # Читання ціни змінює купи розкладу, тож під замком виконується саме звернення до розкладу.
+    # Перевірка «чи є кампанії» відбувається без замка: застаріла відповідь рівнозначна продажу
+    # до чи після паралельного add_campaign, а percent_for коректно обробляє порожній розклад
+    def _campaign_percent(self, product_name: str, product_type: str):
+        with self._campaign_lock:
+            return super()._campaign_percent(product_name, product_type)
+
+    def get_all_products(self) -> list:
+        with self._catalog_lock:
+            return super().get_all_products()
+
+    @contextlib.contextmanager
+    def _all_locks(self):
+        """Захоплює всі замки набору у фіксованому порядку."""
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+
+# --- ТЕСТУВАННЯ: має бути поза класами ---
+if __name__ == "__main__":
+    print("\n--- Тестування ConcurrentProductStore ---")
+
+    s = ConcurrentProductStore()
+    s.add(Product('Food', 'Ramen', 10), 10_000)
+
+    def worker():
+        for _ in range(2_000):
+            try:
+                s.sell_product('Ramen', 1)
+            except CustomException:
+                pass
+
+    CustomException.log_sink = None
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # 8 потоків намагаються продати 16 000 одиниць, але на складі лише 10 000
+    assert s.get_product_info('Ramen') == ('Ramen', 0)
+    assert s.get_income() == 10_000 * 10 * ProductStore.PRICE_PREMIUM_FACTOR
+    print("✅ Перепродажу немає, дохід збігається.")
+
+    def adder():
+        for i in range(20_000):
+            s.add(Product('Food', f"Noodles-{i}", 1), 1)
+
+    t = threading.Thread(target=adder)
+    t.start()
+    while t.is_alive():
+        sum(1 for _ in s.iter_products())
+        s.get_products_page(limit=100, cursor=1_000)
+    t.join()
+    assert len(list(s.iter_products())) == 20_001
+    print("✅ Перегляд асортименту під час паралельного додавання продуктів.")
+
+    exact = ConcurrentProductStore(accounting='cents')
+    exact.add(Product('Food', 'Ramen', 0.1), 8_000)
+    exact.add(Product('Sport', 'Ball', 10), 8_000)
+    exact.add_campaign('Ball', 50, start=0, end=float('inf'))
+
+    def exact_worker():
+        for _ in range(1_000):
+            exact.sell_product('Ramen', 1)
+            exact.sell_product('Ball', 1)
+
+    threads = [threading.Thread(target=exact_worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # Ramen: 0.13 * 8 000 = 1 040.00; Ball зі знижкою кампанії: 6.50 * 8 000 = 52 000.00
+    assert str(exact.get_income_exact()) == '53040.00'
+    assert str(exact.get_revenue('Ball')) == '52000.00' and str(exact.get_revenue('Food', 'type')) == '1040.00'
+    assert {t: str(v) for t, v in exact.get_revenue_by_type().items()} == {'Food': '1040.00', 'Sport': '52000.00'}
+    print("✅ Точний дохід і кампанії під час паралельних продажів.")
+
+    print("\nВсі тести пройшли успішно!")
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from collections import Counter
+
+
+# --- Результат операції ---
+class OperationResult:
+    """
+    Результат операції (запис на курс, продаж, знижка тощо), який методи повертають замість print().
+    Текст повідомлення формується з шаблону лише тоді, коли його хтось читає.
+    """
+    __slots__ = ('event', 'ok', 'template', 'data')
+
+    def __init__(self, event: str, ok: bool, template: str, **data):
+        self.event = event
+        self.ok = ok
+        self.template = template
+        self.data = data
+
+    @property
+    def message(self) -> str:
+        return self.template.format(**self.data)
+
+    def __bool__(self):
+        return self.ok
+
+    def __repr__(self):
+        return f"OperationResult(event='{self.event}', ok={self.ok}, data={self.data})"
+
+
+# --- Шина подій ---
+class EventBus:
+    """
+    Розсилає результати операцій підписникам. Без підписників нічого не виводиться
+    і не форматується, тому операції в робочому режимі не витрачають час на консоль.
+    """
+    def __init__(self):
+        self._subscribers = []
+
+    def subscribe(self, subscriber):
+        """Додає підписника — будь-який виклик, що приймає OperationResult."""
+        self._subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        self._subscribers.remove(subscriber)
+
+    def emit(self, result: OperationResult) -> OperationResult:
+        for subscriber in self._subscribers:
+            subscriber(result)
+        return result
+
+
+# --- Підписники ---
+class ConsoleSubscriber:
+    """Виводить повідомлення в консоль — так, як методи робили раніше через print()."""
+    def __call__(self, result: OperationResult):
+        print(result.message)
+
+
+class LoggingSubscriber:
+    """Передає повідомлення в модуль logging (помилки — з рівнем WARNING)."""
+    def __init__(self, logger: logging.Logger = None):
+        import logging  # імпортується лише тоді, коли логування справді потрібне
+
+        self.logger = logger or logging.getLogger('hw16')
+        self._levels = {True: logging.INFO, False: logging.WARNING}
+
+    def __call__(self, result: OperationResult):
+        self.logger.log(self._levels[result.ok], result.message)
+
+
+class CounterSubscriber:
+    """Рахує події за назвою та результатом, наприклад ('sold', True)."""
+    def __init__(self):
+        self.counts = Counter()
+
+    def __call__(self, result: OperationResult):
+        self.counts[(result.event, result.ok)] += 1
+
+
+class JsonLinesSubscriber:
+    """Записує кожну подію одним рядком JSON у відкритий текстовий файл."""
+    def __init__(self, stream):
+        import json
+
+        self.stream = stream
+        self._dumps = json.dumps
+
+    def __call__(self, result: OperationResult):
+        record = {'event': result.event, 'ok': result.ok, **result.data}
+        self.stream.write(self._dumps(record, ensure_ascii=False, default=str) + '\n')
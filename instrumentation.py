@@ -0,0 +1,160 @@
+import contextlib
+import functools
+import re
+import time
+from collections import Counter, deque
+
+from task_4 import CustomException
+
+
+# --- Інструментування ProductStore ---
+class StoreInstrumentation:
+    """
+    Необов'язкове інструментування методів ProductStore (task_4).
+    attach(store) підміняє методи конкретного екземпляра обгортками, що рахують виклики,
+    сумарний час, перцентилі затримки та помилки за категоріями повідомлень;
+    detach(store) повертає звичайні методи класу. Поки інструментування не підключене,
+    магазин працює без жодних додаткових перевірок.
+    """
+    METHODS = ('add', 'sell_product', 'sell_many', 'set_discount', 'set_premium_factor', 'get_income',
+               'get_all_products', 'get_products_page', 'export_products', 'get_product_info')
+
+    def __init__(self, sample_size: int = 10_000):
+        """
+        Аргументи:
+            sample_size (int): Скільки останніх вимірів затримки зберігати для кожного методу.
+        """
+        self.sample_size = sample_size
+        self.calls = Counter()
+        self.total_time = Counter()
+        self.errors = Counter()  # (метод, категорія повідомлення) -> кількість
+        self._latencies = {}
+        self.profile_report = None
+
+    def attach(self, store):
+        for name in self.METHODS:
+            setattr(store, name, self._wrap(name, getattr(store, name)))
+        return store
+
+    def detach(self, store):
+        for name in self.METHODS:
+            store.__dict__.pop(name, None)
+        return store
+
+    def _wrap(self, name: str, method):
+        latencies = self._latencies.setdefault(name, deque(maxlen=self.sample_size))
+        calls, total_time, errors = self.calls, self.total_time, self.errors
+        clock = time.perf_counter
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            except CustomException as e:
+                errors[(name, error_category(str(e)))] += 1
+                raise
+            finally:
+                elapsed = clock() - start
+                calls[name] += 1
+                total_time[name] += elapsed
+                latencies.append(elapsed)
+        return wrapper
+
+    def reset(self):
+        self.calls.clear()
+        self.total_time.clear()
+        self.errors.clear()
+        for latencies in self._latencies.values():
+            latencies.clear()
+
+    def report(self) -> dict:
+        """
+        Повертає статистику за методами: кількість викликів, сумарний час (с),
+        перцентилі затримки (мкс) за останніми sample_size викликами та кількість помилок.
+        """
+        stats = {}
+        for name, latencies in self._latencies.items():
+            if not self.calls[name]:
+                continue
+            ordered = sorted(latencies)
+            pick = lambda p: ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))] * 1e6
+            stats[name] = {
+                'calls': self.calls[name],
+                'total_s': self.total_time[name],
+                'p50_us': pick(50),
+                'p95_us': pick(95),
+                'p99_us': pick(99),
+                'errors': {category: count for (method, category), count in self.errors.items() if method == name},
+            }
+        return stats
+
+    def format_report(self) -> str:
+        lines = [f"{'метод':<20} {'викликів':>10} {'сума, с':>10} {'p50, мкс':>10} {'p99, мкс':>10} {'помилок':>8}"]
+        for name, stat in sorted(self.report().items(), key=lambda item: -item[1]['total_s']):
+            lines.append(f"{name:<20} {stat['calls']:>10,} {stat['total_s']:>10.4f} {stat['p50_us']:>10.2f} "
+                         f"{stat['p99_us']:>10.2f} {sum(stat['errors'].values()):>8,}")
+            for category, count in stat['errors'].items():
+                lines.append(f"    {count:>6,} x {category}")
+        return '\n'.join(lines)
+
+    @contextlib.contextmanager
+    def profile(self, path: str = None, sort: str = 'cumulative', limit: int = 30):
+        """
+        Профілює всі операції всередині блоку with через cProfile.
+        Після виходу звіт доступний у self.profile_report і, якщо задано path, записується у файл.
+        """
+        import cProfile
+        import io
+        import pstats
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield profiler
+        finally:
+            profiler.disable()
+            stream = io.StringIO()
+            pstats.Stats(profiler, stream=stream).sort_stats(sort).print_stats(limit)
+            self.profile_report = stream.getvalue()
+            if path is not None:
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(self.profile_report)
+
+
+def error_category(message: str) -> str:
+    """
+    Зводить повідомлення про помилку до категорії, прибираючи змінні частини:
+    "Недостатньо 'Ramen' на складі. Доступно: 3, запитано: 5." -> "Недостатньо '…' на складі. Доступно: N, запитано: N."
+    """
+    return re.sub(r"\d+(\.\d+)?", "N", re.sub(r"'[^']*'", "'…'", message))
+
+
+# --- ТЕСТУВАННЯ: має бути поза класами ---
+if __name__ == "__main__":
+    from task_4 import Product, ProductStore
+
+    print("\n--- Тестування StoreInstrumentation ---")
+    CustomException.log_sink = None
+
+    s = ProductStore()
+    instrumentation = StoreInstrumentation()
+    instrumentation.attach(s)
+
+    s.add(Product('Food', 'Ramen', 1.5), 100)
+    with instrumentation.profile():
+        for _ in range(150):
+            try:
+                s.sell_product('Ramen', 1)
+            except CustomException:
+                pass
+
+    assert instrumentation.calls['sell_product'] == 150
+    assert instrumentation.report()['sell_product']['errors'] == {
+        "Недостатньо '…' на складі. Доступно: N, запитано: N.": 50}
+    print(instrumentation.format_report())
+
+    instrumentation.detach(s)
+    s.get_income()
+    assert instrumentation.calls['get_income'] == 0
+    print("\nВсі тести пройшли успішно!")
@@ -0,0 +1,19 @@
+# --- Точні грошові розрахунки в копійках ---
+def unit_price_cents(price: float, premium_factor: float, discount_percent: float) -> int:
+    """
+    Повертає ціну за одиницю (ціна * націнка * (1 - знижка / 100)) у цілих копійках,
+    округлену до найближчої копійки, половина — вгору (ROUND_HALF_UP).
+    Числа беруться за їхнім десятковим записом: 1.3 рахується як 1.3,
+    а не як 1.3000000000000000444 у двійковому float.
+    """
+    from decimal import ROUND_HALF_UP, Decimal  # потрібен лише при обчисленні нової ціни
+
+    cents = Decimal(repr(price)) * Decimal(repr(premium_factor)) * (100 - Decimal(repr(discount_percent)))
+    return int(cents.quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def cents_to_decimal(cents: int) -> 'Decimal':
+    """Перетворює суму в копійках на Decimal з двома знаками після коми."""
+    from decimal import Decimal
+
+    return Decimal(cents).scaleb(-2)
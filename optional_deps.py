@@ -0,0 +1,15 @@
+import functools
+
+
+# --- Ліниве завантаження необов'язкових залежностей ---
+@functools.lru_cache(maxsize=None)
+def load_numpy():
+    """
+    Імпортує NumPy при першому виклику й повертає модуль (або None, якщо NumPy не встановлено).
+    Модулі проєкту не імпортують NumPy під час власного імпорту, тож запуск без нього не сповільнюється.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
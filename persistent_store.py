@@ -0,0 +1,212 @@
+import json
+import mmap
+import os
+import struct
+from array import array
+
+from columnar_store import ColumnarProductStore
+from task_4 import CustomException, Product
+
+
+# Заголовок знімка: сигнатура, номер останнього застосованого запису журналу,
+# кількість продуктів, кількість типів, дохід
+SNAPSHOT_MAGIC = b'PSTORE01'
+SNAPSHOT_HEADER = struct.Struct('<8sQQQd')
+
+
+# --- Клас PersistentProductStore ---
+class PersistentProductStore(ColumnarProductStore):
+    """
+    Стовпцевий магазин, що зберігає стан на диску в каталозі directory:
+      snapshot.bin — компактний двійковий знімок стовпців (ціни, кількості, знижки, типи, назви)
+                     та доходу; при запуску файл відображається в пам'ять (mmap), і стовпці
+                     копіюються в масиви цілими блоками, без повторного add для кожного продукту;
+      wal.log      — журнал операцій add/sell_product/set_discount, що дописується в кінець.
+    Записи журналу скидаються на диск групами (group commit): fsync виконується раз на
+    group_commit записів або при виклику commit()/close(). Отже, після збою можуть
+    загубитися лише останні записи незавершеної групи.
+    Після збою відновлення читає знімок і повторює лише ті записи журналу, що новіші за нього.
+    Назви продуктів і типів не повинні містити символ '\\0' (він розділяє рядки у знімку).
+    """
+    SNAPSHOT_FILE = 'snapshot.bin'
+    WAL_FILE = 'wal.log'
+
+    def __init__(self, directory: str, group_commit: int = 1000):
+        super().__init__()
+        self.directory = directory
+        self.group_commit = group_commit
+        self._seq = 0           # номер останньої операції
+        self._pending = []      # записи журналу, що ще не скинуті на диск
+        os.makedirs(directory, exist_ok=True)
+
+        self._load_snapshot()
+        self._replay_wal()
+        self._wal = open(self._path(self.WAL_FILE), 'a', encoding='utf-8')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _path(self, file_name: str) -> str:
+        return os.path.join(self.directory, file_name)
+
+    # --- Операції, що журналюються ---
+    def add(self, product: Product, amount: int):
+        super().add(product, amount)
+        self._log({'op': 'add', 'type': product.type, 'name': product.name, 'price': product.price, 'amount': amount})
+
+    def sell_product(self, product_name: str, amount: int):
+        super().sell_product(product_name, amount)
+        self._log({'op': 'sell', 'name': product_name, 'amount': amount})
+
+    def set_discount(self, identifier, percent, identifier_type: str = 'name'):
+        super().set_discount(identifier, percent, identifier_type)
+        self._log({'op': 'discount', 'identifier': identifier, 'percent': percent, 'identifier_type': identifier_type})
+
+    def _log(self, record: dict):
+        self._seq += 1
+        record['seq'] = self._seq
+        self._pending.append(json.dumps(record, ensure_ascii=False) + '\n')
+        if len(self._pending) >= self.group_commit:
+            self.commit()
+
+    def commit(self):
+        """Скидає на диск усі накопичені записи журналу одним write + fsync."""
+        if self._pending:
+            self._wal.write(''.join(self._pending))
+            self._wal.flush()
+            os.fsync(self._wal.fileno())
+            self._pending = []
+
+    def checkpoint(self):
+        """
+        Записує новий знімок і очищає журнал.
+        Знімок спершу пишеться у тимчасовий файл і атомарно замінює старий, тож збій
+        посередині не пошкоджує попередній знімок; записи журналу, які вже увійшли
+        до знімка, при відновленні пропускаються за номером.
+        """
+        self.commit()
+        names = '\0'.join(self._names).encode('utf-8')
+        types = '\0'.join(self._types).encode('utf-8')
+        tmp_path = self._path(self.SNAPSHOT_FILE + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, self._seq, len(self._names), len(self._types), self.income))
+            for column in (self._prices, self._amounts, self._discounts, self._type_ids):
+                f.write(column.tobytes())
+            for blob in (names, types):
+                f.write(struct.pack('<Q', len(blob)))
+                f.write(blob)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._path(self.SNAPSHOT_FILE))
+
+        self._wal.close()
+        self._wal = open(self._path(self.WAL_FILE), 'w', encoding='utf-8')
+
+    def close(self):
+        self.commit()
+        self._wal.close()
+
+    # --- Відновлення ---
+    def _load_snapshot(self):
+        path = self._path(self.SNAPSHOT_FILE)
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return
+
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, self._seq, n_rows, n_types, self.income = SNAPSHOT_HEADER.unpack_from(mm, 0)
+            if magic != SNAPSHOT_MAGIC:
+                raise CustomException(f"Файл '{path}' не є знімком магазину.")
+
+            offset = SNAPSHOT_HEADER.size
+            for column in (self._prices, self._amounts, self._discounts, self._type_ids):
+                size = n_rows * column.itemsize
+                column.frombytes(mm[offset:offset + size])
+                offset += size
+
+            blobs = []
+            for _ in range(2):
+                (size,) = struct.unpack_from('<Q', mm, offset)
+                offset += 8
+                blobs.append(mm[offset:offset + size].decode('utf-8'))
+                offset += size
+
+        self._names = blobs[0].split('\0') if n_rows else []
+        self._types = blobs[1].split('\0') if n_types else []
+        self._rows = dict(zip(self._names, range(n_rows)))
+        self._type_codes = dict(zip(self._types, range(n_types)))
+        self._rows_by_type = {type_code: array('q') for type_code in range(n_types)}
+        for row, type_code in enumerate(self._type_ids):
+            self._rows_by_type[type_code].append(row)
+
+    def _replay_wal(self):
+        path = self._path(self.WAL_FILE)
+        if not os.path.exists(path):
+            return
+
+        good_offset = 0  # кінець останнього цілого запису
+        with open(path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # обірваний останній запис після збою
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                good_offset += len(line)
+                if record['seq'] <= self._seq:
+                    continue  # операція вже є у знімку
+                self._apply(record)
+                self._seq = record['seq']
+
+            # Інакше нові записи дописувалися б до обірваного рядка й губилися при наступному відновленні
+            if good_offset < os.fstat(f.fileno()).st_size:
+                os.truncate(path, good_offset)
+
+    def _apply(self, record: dict):
+        op = record['op']
+        if op == 'add':
+            ColumnarProductStore.add(self, Product(record['type'], record['name'], record['price']), record['amount'])
+        elif op == 'sell':
+            ColumnarProductStore.sell_product(self, record['name'], record['amount'])
+        elif op == 'discount':
+            ColumnarProductStore.set_discount(self, record['identifier'], record['percent'], record['identifier_type'])
+
+
+# --- ТЕСТУВАННЯ: має бути поза класами ---
+if __name__ == "__main__":
+    import tempfile
+
+    print("\n--- Тестування PersistentProductStore ---")
+
+    with tempfile.TemporaryDirectory() as directory:
+        with PersistentProductStore(directory) as s:
+            s.add(Product('Sport', 'Football T-Shirt', 100), 10)
+            s.add(Product('Food', 'Ramen', 1.5), 300)
+            s.checkpoint()
+            s.sell_product('Ramen', 10)
+            s.set_discount('Sport', 20, identifier_type='type')
+            s.sell_product('Football T-Shirt', 5)
+            income = s.get_income()
+
+        # Знімок містить два продукти, решта операцій відтворюється з журналу
+        with PersistentProductStore(directory) as s:
+            assert s.get_product_info('Ramen') == ('Ramen', 290)
+            assert s.get_product_info('Football T-Shirt') == ('Football T-Shirt', 5)
+            assert s.get_income() == income
+        print("✅ Стан відновлено зі знімка та журналу.")
+
+        # Збій посеред запису: обірваний хвіст журналу відкидається, нові записи не губляться
+        with open(os.path.join(directory, PersistentProductStore.WAL_FILE), 'a', encoding='utf-8') as wal:
+            wal.write('{"op": "sell", "name": "Ramen", "amo')
+        with PersistentProductStore(directory) as s:
+            s.sell_product('Ramen', 10)
+            s.add(Product('Food', 'Udon', 2), 5)
+        with PersistentProductStore(directory) as s:
+            assert s.get_product_info('Ramen') == ('Ramen', 280)
+            assert s.get_product_info('Udon') == ('Udon', 5)
+        print("✅ Після обірваного запису журнал продовжується коректно.")
+
+    print("\nВсі тести пройшли успішно!")
@@ -0,0 +1,205 @@
+import os
+import zlib
+
+from task_4 import CustomException, Product, ProductStore
+
+
+# --- Клас ShardedProductStore ---
+class ShardedProductStore:
+    """
+    ProductStore, розподілений між процесами: кожен із shards процесів володіє власним
+    ProductStore з частиною асортименту (продукт потрапляє в шард crc32(назва) % shards).
+    Цей об'єкт — локальний координатор: операції з одним продуктом надсилаються шарду-власнику,
+    а set_discount за типом, get_income, get_all_products і set_premium_factor розсилаються
+    всім шардам одночасно, після чого результати об'єднуються.
+
+    Кожен виклик — це обмін повідомленнями з процесом, тож масштабування за ядрами дає
+    sell_batch: замовлення групуються за шардами й обробляються всіма процесами паралельно.
+    Помилки з шардів повторно піднімаються тут як CustomException (і журналюються лише
+    в процесі координатора).
+    """
+    def __init__(self, shards: int = None):
+        import multiprocessing
+
+        self.shards = shards or os.cpu_count() or 1
+        self._connections = []
+        self._processes = []
+        for _ in range(self.shards):
+            parent_conn, child_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_shard_worker, args=(child_conn,), daemon=True)
+            process.start()
+            child_conn.close()
+            self._connections.append(parent_conn)
+            self._processes.append(process)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        for conn in self._connections:
+            conn.send(None)
+            conn.close()
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
+
+    def shard_of(self, product_name: str) -> int:
+        if not isinstance(product_name, str):
+            return 0  # шард сам відхилить некоректну назву
+        return zlib.crc32(product_name.encode()) % self.shards
+
+    def add(self, product: Product, amount: int):
+        self._call(self.shard_of(getattr(product, 'name', None)), 'add', product, amount)
+
+    def sell_product(self, product_name: str, amount: int):
+        self._call(self.shard_of(product_name), 'sell_product', product_name, amount)
+
+    def get_product_info(self, product_name: str) -> tuple:
+        return self._call(self.shard_of(product_name), 'get_product_info', product_name)
+
+    def set_discount(self, identifier: str | int, percent: int | float, identifier_type: str = 'name'):
+        if identifier_type != 'type':
+            return self._call(self.shard_of(identifier), 'set_discount', identifier, percent, identifier_type)
+
+        replies = self._broadcast('set_discount', identifier, percent, identifier_type)
+        # Продукти типу можуть бути лише в частині шардів; помилка — тільки якщо їх немає ніде
+        if all(not ok for ok, _ in replies):
+            raise CustomException(replies[0][1])
+
+    def set_premium_factor(self, factor: float):
+        self._unwrap(self._broadcast('set_premium_factor', factor))
+
+    def get_income(self) -> float:
+        return sum(self._unwrap(self._broadcast('get_income')))
+
+    def get_all_products(self) -> list:
+        # Продукти впорядковані за шардами, а в межах шарду — в порядку додавання
+        return [product for products in self._unwrap(self._broadcast('get_all_products')) for product in products]
+
+    def sell_batch(self, orders) -> list:
+        """
+        Продає замовлення (назва, кількість) незалежно одне від одного — на відміну від
+        ProductStore.sell_many, невдале замовлення не скасовує інших. Повертає список того ж
+        розміру: None для успішного продажу або текст помилки.
+        """
+        if isinstance(orders, dict):
+            orders = orders.items()
+        orders = list(orders)
+        for order in orders:
+            if not isinstance(order, (tuple, list)) or len(order) != 2:
+                raise CustomException("Замовлення має бути парою (назва продукту, кількість).")
+        positions = [[] for _ in range(self.shards)]
+        batches = [[] for _ in range(self.shards)]
+        for position, order in enumerate(orders):
+            shard = self.shard_of(order[0])
+            positions[shard].append(position)
+            batches[shard].append(order)
+
+        active = [shard for shard in range(self.shards) if batches[shard]]
+        for shard in active:
+            self._connections[shard].send(('sell_batch', (batches[shard],)))
+        results = [None] * len(orders)
+        for shard in active:
+            _, errors = self._connections[shard].recv()
+            for position, error in zip(positions[shard], errors):
+                results[position] = error
+        return results
+
+    def _call(self, shard: int, method: str, *args):
+        conn = self._connections[shard]
+        conn.send((method, args))
+        ok, value = conn.recv()
+        if not ok:
+            raise CustomException(value)
+        return value
+
+    def _broadcast(self, method: str, *args) -> list:
+        # Спершу надсилаємо запит усім шардам, потім збираємо відповіді — шарди працюють паралельно
+        for conn in self._connections:
+            conn.send((method, args))
+        return [conn.recv() for conn in self._connections]
+
+    @staticmethod
+    def _unwrap(replies: list) -> list:
+        for ok, value in replies:
+            if not ok:
+                raise CustomException(value)
+        return [value for _, value in replies]
+
+
+# --- Функція, що виконується у процесі шарду ---
+def _shard_worker(conn):
+    CustomException.log_sink = None  # помилки журналює координатор
+    store = ProductStore()
+    while True:
+        request = conn.recv()
+        if request is None:
+            break
+        method, args = request
+        if method == 'sell_batch':
+            conn.send((True, _sell_batch(store, *args)))
+            continue
+        try:
+            conn.send((True, getattr(store, method)(*args)))
+        except Exception as e:
+            # Будь-яка помилка повертається координатору, а шард із своєю частиною каталогу працює далі
+            conn.send((False, _error_message(e)))
+    conn.close()
+
+
+def _error_message(error: Exception) -> str:
+    return str(error) if isinstance(error, CustomException) else f"{type(error).__name__}: {error}"
+
+
+def _sell_batch(store: ProductStore, orders: list) -> list:
+    errors = []
+    for product_name, amount in orders:
+        try:
+            store.sell_product(product_name, amount)
+            errors.append(None)
+        except Exception as e:
+            errors.append(_error_message(e))
+    return errors
+
+
+# --- ТЕСТУВАННЯ: має бути поза класами ---
+if __name__ == "__main__":
+    print("\n--- Тестування ShardedProductStore ---")
+    CustomException.log_sink = None
+
+    with ShardedProductStore(shards=3) as s:
+        for i in range(30):
+            s.add(Product('Food' if i % 2 else 'Sport', f"Product-{i}", 10), 5)
+
+        s.sell_product('Product-1', 2)
+        assert s.get_product_info('Product-1') == ('Product-1', 3)
+        print("✅ Продаж надіслано шарду-власнику.")
+
+        s.set_discount('Food', 50, identifier_type='type')
+        errors = s.sell_batch([('Product-1', 1), ('Product-2', 1), ('Product-3', 100), ('Missing', 1)])
+        assert errors[:2] == [None, None] and errors[2] and errors[3]
+        assert s.get_income() == 2 * 13 + 6.5 + 13
+        print("✅ Знижку за типом розіслано всім шардам, дохід об'єднано.")
+
+        assert len(s.get_all_products()) == 30
+        for bad_call in (lambda: s.set_discount('Product-1', 'ten'), lambda: s.sell_batch([('Product-1', 1, 2)])):
+            try:
+                bad_call()
+            except CustomException:
+                pass
+            else:
+                raise AssertionError("очікувалась помилка")
+        assert s.get_product_info('Product-1') == ('Product-1', 2)
+        try:
+            s.set_discount('Missing', 10, identifier_type='type')
+        except CustomException:
+            pass
+        else:
+            raise AssertionError("очікувалась помилка для відсутнього типу")
+        print("✅ Асортимент і помилки об'єднуються з усіх шардів, шарди переживають помилки.")
+
+    print("\nВсі тести пройшли успішно!")
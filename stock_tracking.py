@@ -0,0 +1,99 @@
+import heapq
+
+from events import EventBus, OperationResult
+
+
+# --- Відстеження залишків і продажів ---
+class StockTracker:
+    """
+    Інкрементні індекси залишків і продажів для ProductStore.
+    - Купа (кількість, назва) відповідає на low_stock(threshold) без сортування асортименту.
+    - Купа (-продано, назва) відповідає на top_sellers(k).
+    Кожна зміна додає в купу новий запис за O(log n); застарілі записи не видаляються одразу,
+    а пропускаються під час читання, і купа перебудовується, коли їх стає більше, ніж актуальних.
+    Читання обходить купу від вершини, тож коштує O(k log k) для k результатів.
+
+    Коли залишок продукту опускається до рівня дозамовлення (reorder_level або рівень,
+    заданий для продукту через set_reorder_level) чи нижче, в alerts надсилається подія 'reorder'.
+    """
+    def __init__(self, reorder_level: int = None, events: EventBus = None):
+        self.reorder_level = reorder_level
+        self.alerts = events if events is not None else EventBus()
+        self._amounts = {}
+        self._sold = {}
+        self._reorder_levels = {}
+        self._stock_heap = []  # (кількість, назва)
+        self._sales_heap = []  # (-продано, назва)
+
+    def load(self, amounts: dict):
+        """Будує індекс залишків з готового словника назва -> кількість за O(n)."""
+        self._amounts.update(amounts)
+        self._stock_heap = [(amount, name) for name, amount in self._amounts.items()]
+        heapq.heapify(self._stock_heap)
+
+    def set_reorder_level(self, product_name: str, level: int):
+        self._reorder_levels[product_name] = level
+
+    def update(self, product_name: str, amount: int, sold: int = 0):
+        """Фіксує новий залишок продукту та (для продажу) кількість проданих одиниць."""
+        previous = self._amounts.get(product_name)
+        self._amounts[product_name] = amount
+        heapq.heappush(self._stock_heap, (amount, product_name))
+        if len(self._stock_heap) > 2 * len(self._amounts) + 64:
+            self._stock_heap = [(amount, name) for name, amount in self._amounts.items()]
+            heapq.heapify(self._stock_heap)
+
+        if sold:
+            total = self._sold[product_name] = self._sold.get(product_name, 0) + sold
+            heapq.heappush(self._sales_heap, (-total, product_name))
+            if len(self._sales_heap) > 2 * len(self._sold) + 64:
+                self._sales_heap = [(-total, name) for name, total in self._sold.items()]
+                heapq.heapify(self._sales_heap)
+
+        level = self._reorder_levels.get(product_name, self.reorder_level)
+        if level is not None and amount <= level and (previous is None or previous > level):
+            self.alerts.emit(OperationResult(
+                'reorder', True, "Залишок '{name}' знизився до {amount} (рівень дозамовлення: {level}).",
+                name=product_name, amount=amount, level=level))
+
+    def low_stock(self, threshold: int) -> list:
+        """Повертає [(назва, кількість)] продуктів із залишком <= threshold, від найменшого."""
+        amounts = self._amounts
+        entries = _iter_heap(self._stock_heap, lambda entry: entry[0] > threshold)
+        return _current(((name, amount) for amount, name in entries), lambda name, amount: amounts[name] == amount)
+
+    def top_sellers(self, k: int) -> list:
+        """Повертає до k пар (назва, продано) від найбільших продажів."""
+        sold = self._sold
+        entries = ((name, -total) for total, name in _iter_heap(self._sales_heap))
+        return _current(entries, lambda name, total: sold[name] == total, k)
+
+
+# --- Допоміжні функції для куп ---
+def _iter_heap(heap: list, stop=None):
+    """Повертає записи купи в порядку зростання, не змінюючи її (обхід від вершини з допоміжною купою)."""
+    if not heap:
+        return
+    candidates = [(heap[0], 0)]
+    size = len(heap)
+    while candidates:
+        entry, index = heapq.heappop(candidates)
+        if stop is not None and stop(entry):
+            return
+        yield entry
+        for child in (2 * index + 1, 2 * index + 2):
+            if child < size:
+                heapq.heappush(candidates, (heap[child], child))
+
+
+def _current(entries, is_current, limit: int = None) -> list:
+    """Відкидає застарілі та повторні записи й повертає не більше limit актуальних."""
+    result = []
+    seen = set()
+    for name, value in entries:
+        if limit is not None and len(result) >= limit:
+            break
+        if name not in seen and is_current(name, value):
+            seen.add(name)
+            result.append((name, value))
+    return result
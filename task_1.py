@@ -1,9 +1,19 @@
+import heapq
+import math
+from array import array
+
+from events import ConsoleSubscriber, EventBus, OperationResult
+from optional_deps import load_numpy
+
 class Person:
     """
     Базовий клас, що представляє будь-яку особу у школі.
     Містить спільні атрибути та методи.
     """
-    def __init__(self, name: str, age: int, gender: str):
+    # __slots__ замість __dict__ у кожному екземплярі: менше пам'яті на великих списках учнів
+    __slots__ = ('name', 'age', 'gender', 'events')
+
+    def __init__(self, name: str, age: int, gender: str, events: EventBus = None):
         """
         Ініціалізує об'єкт Person.
 
@@ -11,10 +21,18 @@ class Person:
             name (str): Повне ім'я особи.
             age (int): Вік особи.
             gender (str): Стать особи.
+            events (EventBus): Шина подій для результатів операцій цієї особи (наприклад, спільна
+                               для однієї школи); None — результати лише повертаються, без розсилки.
         """
         self.name = name
         self.age = age
         self.gender = gender
+        self.events = events
+
+    def _emit(self, result: OperationResult) -> OperationResult:
+        """Надсилає результат операції в шину подій особи (якщо вона задана) і повертає його."""
+        events = self.events
+        return result if events is None else events.emit(result)
 
     def introduce(self) -> str:
         """
@@ -33,7 +51,10 @@ class Student(Person):
     Клас, що представляє учня у школі.
     Успадковує від класу Person та додає специфічні атрибути та методи.
     """
-    def __init__(self, name: str, age: int, gender: str, student_id: str, grade_level: int):
+    __slots__ = ('student_id', 'grade_level', '_courses', 'grades')
+
+    def __init__(self, name: str, age: int, gender: str, student_id: str, grade_level: int,
+                 events: EventBus = None):
         """
         Ініціалізує об'єкт Student.
 
@@ -43,29 +64,57 @@ class Student(Person):
             gender (str): Стать учня.
             student_id (str): Унікальний ідентифікатор учня.
             grade_level (int): Клас, у якому навчається учень.
+            events (EventBus): Шина подій (див. Person).
         """
         # Викликаємо конструктор батьківського класу (Person)
-        super().__init__(name, age, gender)
+        super().__init__(name, age, gender, events)
         self.student_id = student_id
         self.grade_level = grade_level
-        self.courses = [] # Список курсів, на які записаний студент
+        # Курси, на які записаний студент: ключі словника зберігають порядок запису
+        # і дають перевірку за O(1) без окремої множини в кожному екземплярі
+        self._courses = {}
         self.grades = {}  # Додано: словник для зберігання оцінок (курс -> оцінка)
 
-    def enroll_course(self, course_name: str):
+    @property
+    def courses(self) -> tuple:
+        """Курси студента в порядку запису (кортеж лише для читання; записувати на курс слід через enroll_course)."""
+        return tuple(self._courses)
+
+    @courses.setter
+    def courses(self, course_names):
+        self._courses = dict.fromkeys(course_names)
+
+    def enroll_course(self, course_name: str) -> OperationResult:
         """
         Записує студента на курс.
         """
-        if course_name not in self.courses:
-            self.courses.append(course_name)
-            print(f"{self.name} записано на курс '{course_name}'.")
-        else:
-            print(f"{self.name} вже записаний на курс '{course_name}'.")
+        if self._enroll(course_name):
+            return self._emit(OperationResult(
+                'enrolled', True, "{student} записано на курс '{course}'.", student=self.name, course=course_name))
+        return self._emit(OperationResult(
+            'enrolled', False, "{student} вже записаний на курс '{course}'.", student=self.name, course=course_name))
+
+    def is_enrolled(self, course_name: str) -> bool:
+        """
+        Перевіряє, чи записаний студент на курс.
+        """
+        return course_name in self._courses
+
+    def _enroll(self, course_name: str) -> bool:
+        """
+        Записує студента на курс без виведення повідомлень.
+        Повертає True, якщо студента записано, і False, якщо він уже був записаний.
+        """
+        if course_name in self._courses:
+            return False
+        self._courses[course_name] = None
+        return True
 
     def list_courses(self) -> list:
         """
         Повертає список курсів, на які записаний студент.
         """
-        return self.courses
+        return list(self._courses)
 
     def introduce(self) -> str:
         """
@@ -78,7 +127,10 @@ class Teacher(Person):
     Клас, що представляє вчителя у школі.
     Успадковує від класу Person та додає специфічні атрибути та методи.
     """
-    def __init__(self, name: str, age: int, gender: str, employee_id: str, subject: str, salary: float):
+    __slots__ = ('employee_id', 'subject', 'salary', '_classes_taught')
+
+    def __init__(self, name: str, age: int, gender: str, employee_id: str, subject: str, salary: float,
+                 events: EventBus = None):
         """
         Ініціалізує об'єкт Teacher.
 
@@ -89,34 +141,50 @@ class Teacher(Person):
             employee_id (str): Унікальний ідентифікатор працівника.
             subject (str): Предмет, який викладає вчитель.
             salary (float): Зарплата вчителя.
+            events (EventBus): Шина подій (див. Person).
         """
         # Викликаємо конструктор батьківського класу (Person)
-        super().__init__(name, age, gender)
+        super().__init__(name, age, gender, events)
         self.employee_id = employee_id
         self.subject = subject
         self.salary = salary
-        self.classes_taught = [] # Список класів, які викладає вчитель
+        self._classes_taught = {}  # Класи, які викладає вчитель (ключі — у порядку додавання)
 
-    def assign_grade(self, student: Student, course: str, grade: str):
+    @property
+    def classes_taught(self) -> tuple:
+        """Класи, які викладає вчитель (кортеж лише для читання; додавати слід через add_class_taught)."""
+        return tuple(self._classes_taught)
+
+    @classes_taught.setter
+    def classes_taught(self, class_names):
+        self._classes_taught = dict.fromkeys(class_names)
+
+    def assign_grade(self, student: Student, course: str, grade: str) -> OperationResult:
         """
         Призначає оцінку студенту за певний курс.
         Оцінка зберігається у словнику grades студента.
         """
-        if course in student.courses:
+        if student.is_enrolled(course):
             student.grades[course] = grade # Зберігаємо оцінку у словнику grades студента
-            print(f"{self.name} поставив оцінку '{grade}' студенту {student.name} за курс '{course}'.")
-        else:
-            print(f"Помилка: Студент {student.name} не записаний на курс '{course}'.")
+            return self._emit(OperationResult(
+                'graded', True, "{teacher} поставив оцінку '{grade}' студенту {student} за курс '{course}'.",
+                teacher=self.name, student=student.name, course=course, grade=grade))
+        return self._emit(OperationResult(
+            'graded', False, "Помилка: Студент {student} не записаний на курс '{course}'.",
+            teacher=self.name, student=student.name, course=course, grade=grade))
 
-    def add_class_taught(self, class_name: str):
+    def add_class_taught(self, class_name: str) -> OperationResult:
         """
         Додає клас до списку класів, які викладає вчитель.
         """
-        if class_name not in self.classes_taught:
-            self.classes_taught.append(class_name)
-            print(f"{self.name} тепер викладає у класі '{class_name}'.")
-        else:
-            print(f"{self.name} вже викладає у класі '{class_name}'.")
+        if class_name not in self._classes_taught:
+            self._classes_taught[class_name] = None
+            return self._emit(OperationResult(
+                'class_added', True, "{teacher} тепер викладає у класі '{class_name}'.",
+                teacher=self.name, class_name=class_name))
+        return self._emit(OperationResult(
+            'class_added', False, "{teacher} вже викладає у класі '{class_name}'.",
+            teacher=self.name, class_name=class_name))
 
     def introduce(self) -> str:
         """
@@ -124,36 +192,371 @@ class Teacher(Person):
         """
         return f"{super().introduce()} Я викладач {self.subject}, мій ID: {self.employee_id}."
 
+class GradeBook:
+    """
+    Стовпцеве сховище оцінок для звітів за курсами та класами навчання.
+    Кожна оцінка — рядок у суцільних масивах (курс, учень, клас навчання, оцінка, бали),
+    тому розподіли, середні та рейтинги рахуються агрегацією по масивах
+    (векторно через NumPy, якщо він встановлений), без обходу об'єктів Student.
+    Повторна оцінка того самого учня за той самий курс замінює попередню.
+    """
+    # Бали для словесних оцінок; числові оцінки використовуються як є
+    GRADE_POINTS = {'Відмінно': 5, 'Добре': 4, 'Задовільно': 3, 'Незадовільно': 2}
+
+    def __init__(self):
+        """
+        Ініціалізує порожнє сховище оцінок.
+        """
+        self._rows = {}  # (курс, student_id) -> номер рядка
+        self._course_codes, self._courses = {}, []
+        self._student_codes, self._student_ids = {}, []
+        self._grade_codes, self._grades = {}, []
+        self._course_col = array('q')
+        self._student_col = array('q')
+        self._grade_level_col = array('q')
+        self._grade_col = array('q')
+        self._points_col = array('d')
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @staticmethod
+    def _code(codes: dict, values: list, value) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(values)
+            values.append(value)
+        return code
+
+    def record(self, course: str, student_id: str, grade_level: int, grade):
+        """
+        Записує (або замінює) оцінку учня за курс.
+        """
+        points = grade if isinstance(grade, (int, float)) else self.GRADE_POINTS.get(grade, math.nan)
+        grade_code = self._code(self._grade_codes, self._grades, grade)
+        row = self._rows.get((course, student_id))
+        if row is not None:
+            self._grade_col[row] = grade_code
+            self._points_col[row] = points
+            return
+
+        self._rows[(course, student_id)] = len(self._course_col)
+        self._course_col.append(self._code(self._course_codes, self._courses, course))
+        self._student_col.append(self._code(self._student_codes, self._student_ids, student_id))
+        self._grade_level_col.append(grade_level)
+        self._grade_col.append(grade_code)
+        self._points_col.append(points)
+
+    def _select(self, column: array, value_code: int) -> list:
+        """Повертає номери рядків, у яких column дорівнює value_code."""
+        np = load_numpy()
+        if np is not None:
+            return np.flatnonzero(np.frombuffer(column, dtype=np.int64) == value_code)
+        return [row for row, code in enumerate(column) if code == value_code]
+
+    def _distribution(self, rows) -> dict:
+        np = load_numpy()
+        if np is not None:
+            counts = np.bincount(np.frombuffer(self._grade_col, dtype=np.int64)[rows], minlength=len(self._grades))
+            return {self._grades[code]: int(count) for code, count in enumerate(counts) if count}
+        distribution = {}
+        for row in rows:
+            grade = self._grades[self._grade_col[row]]
+            distribution[grade] = distribution.get(grade, 0) + 1
+        return distribution
+
+    def _average(self, rows) -> float:
+        np = load_numpy()
+        if np is not None:
+            points = np.frombuffer(self._points_col, dtype=np.float64)[rows]
+            points = points[~np.isnan(points)]
+            return float(points.mean()) if len(points) else math.nan
+        points = [self._points_col[row] for row in rows if not math.isnan(self._points_col[row])]
+        return sum(points) / len(points) if points else math.nan
+
+    def course_distribution(self, course: str) -> dict:
+        """
+        Повертає розподіл оцінок за курсом: {оцінка: кількість}.
+        """
+        code = self._course_codes.get(course)
+        return {} if code is None else self._distribution(self._select(self._course_col, code))
+
+    def course_average(self, course: str) -> float:
+        """
+        Повертає середній бал за курсом (оцінки без балів не враховуються).
+        """
+        code = self._course_codes.get(course)
+        return math.nan if code is None else self._average(self._select(self._course_col, code))
+
+    def grade_level_distribution(self, grade_level: int) -> dict:
+        """
+        Повертає розподіл оцінок у класі навчання: {оцінка: кількість}.
+        """
+        return self._distribution(self._select(self._grade_level_col, grade_level))
+
+    def grade_level_average(self, grade_level: int) -> float:
+        """
+        Повертає середній бал у класі навчання.
+        """
+        return self._average(self._select(self._grade_level_col, grade_level))
+
+    def averages_by_course(self) -> dict:
+        """
+        Повертає середній бал для кожного курсу одним проходом: {курс: середній бал}.
+        """
+        return dict(zip(self._courses, self._group_averages(self._course_col, len(self._courses))))
+
+    def ranking(self, course: str = None, top: int = 10) -> list:
+        """
+        Повертає рейтинг учнів за середнім балом (за курсом або за всіма курсами).
+
+        Повертає:
+            list: До top пар (student_id, середній бал) у порядку спадання балу.
+        """
+        rows = None
+        if course is not None:
+            code = self._course_codes.get(course)
+            if code is None:
+                return []
+            rows = self._select(self._course_col, code)
+
+        averages = self._group_averages(self._student_col, len(self._student_ids), rows)
+        ranked = [(student_id, average) for student_id, average in zip(self._student_ids, averages)
+                  if not math.isnan(average)]
+        return heapq.nlargest(top, ranked, key=lambda item: item[1])
+
+    def _group_averages(self, column: array, groups: int, rows=None) -> list:
+        """Середній бал для кожного коду групи у column (NaN для груп без балів)."""
+        np = load_numpy()
+        if np is not None:
+            codes = np.frombuffer(column, dtype=np.int64)
+            points = np.frombuffer(self._points_col, dtype=np.float64)
+            if rows is not None:
+                codes, points = codes[rows], points[rows]
+            scored = ~np.isnan(points)
+            totals = np.bincount(codes[scored], weights=points[scored], minlength=groups)
+            counts = np.bincount(codes[scored], minlength=groups)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                return (totals / counts).tolist()
+
+        totals, counts = [0.0] * groups, [0] * groups
+        for row in (range(len(column)) if rows is None else rows):
+            points = self._points_col[row]
+            if not math.isnan(points):
+                totals[column[row]] += points
+                counts[column[row]] += 1
+        return [total / count if count else math.nan for total, count in zip(totals, counts)]
+
+class SchoolRegistry:
+    """
+    Реєстр школи з хеш-індексами для швидкого пошуку учнів і вчителів.
+    Зберігає індекси за student_id, employee_id, курсом (курс -> учні) та класом навчання
+    (grade_level -> учні), тож пошук не потребує перебору всіх об'єктів.
+    Щоб індекс курсів залишався актуальним, записувати учнів на курси слід через enroll/enroll_many.
+    Оцінки, виставлені через assign_grades/assign_gradebook, також потрапляють до gradebook для звітів.
+    """
+    def __init__(self):
+        """
+        Ініціалізує порожній реєстр.
+        """
+        self.students = {}  # student_id -> Student
+        self.teachers = {}  # employee_id -> Teacher
+        self._students_by_course = {}       # курс -> {student_id: Student}
+        self._students_by_grade_level = {}  # клас навчання -> {student_id: Student}
+        self.gradebook = GradeBook()         # усі виставлені оцінки у стовпцевому вигляді
+
+    def add_student(self, student: Student):
+        """
+        Додає учня до реєстру та індексує курси, на які він уже записаний.
+        """
+        if not isinstance(student, Student):
+            raise ValueError("Додавати можна лише об'єкти класу Student.")
+        if student.student_id in self.students:
+            raise ValueError(f"Учень з ID '{student.student_id}' вже є в реєстрі.")
+
+        self.students[student.student_id] = student
+        self._students_by_grade_level.setdefault(student.grade_level, {})[student.student_id] = student
+        for course_name in student._courses:
+            self._students_by_course.setdefault(course_name, {})[student.student_id] = student
+
+    def add_teacher(self, teacher: Teacher):
+        """
+        Додає вчителя до реєстру.
+        """
+        if not isinstance(teacher, Teacher):
+            raise ValueError("Додавати можна лише об'єкти класу Teacher.")
+        if teacher.employee_id in self.teachers:
+            raise ValueError(f"Вчитель з ID '{teacher.employee_id}' вже є в реєстрі.")
+        self.teachers[teacher.employee_id] = teacher
+
+    def get_student(self, student_id: str) -> Student:
+        """
+        Повертає учня за його ID.
+        """
+        if student_id not in self.students:
+            raise ValueError(f"Учня з ID '{student_id}' немає в реєстрі.")
+        return self.students[student_id]
+
+    def get_teacher(self, employee_id: str) -> Teacher:
+        """
+        Повертає вчителя за його ID.
+        """
+        if employee_id not in self.teachers:
+            raise ValueError(f"Вчителя з ID '{employee_id}' немає в реєстрі.")
+        return self.teachers[employee_id]
+
+    def students_in_course(self, course_name: str) -> list:
+        """
+        Повертає список учнів, записаних на курс.
+        """
+        return list(self._students_by_course.get(course_name, {}).values())
+
+    def students_in_grade_level(self, grade_level: int) -> list:
+        """
+        Повертає список учнів указаного класу навчання.
+        """
+        return list(self._students_by_grade_level.get(grade_level, {}).values())
+
+    def enroll(self, student_id: str, course_name: str) -> bool:
+        """
+        Записує учня на курс і оновлює індекс курсів.
+        Повертає True, якщо учня записано, і False, якщо він уже був записаний.
+        """
+        student = self.get_student(student_id)
+        if not student._enroll(course_name):
+            return False
+        self._students_by_course.setdefault(course_name, {})[student_id] = student
+        return True
+
+    def enroll_many(self, enrollments) -> int:
+        """
+        Записує учнів на курси пакетно, без виведення повідомлень для кожного запису.
+
+        Аргументи:
+            enrollments (Iterable[tuple[str, str]]): Пари (student_id, курс).
+
+        Повертає:
+            int: Кількість нових записів.
+        """
+        enrolled = 0
+        for student_id, course_name in enrollments:
+            enrolled += self.enroll(student_id, course_name)
+        return enrolled
+
+    def assign_grades(self, employee_id: str, grades) -> list:
+        """
+        Виставляє оцінки пакетно від імені вчителя.
+        Як і Teacher.assign_grade, пропускає учнів, не записаних на курс; так само пропускаються
+        учні, яких немає в реєстрі, тож одна хибна трійка не зупиняє пакет посередині.
+
+        Аргументи:
+            employee_id (str): ID вчителя, що виставляє оцінки.
+            grades (Iterable[tuple[str, str, str]]): Трійки (student_id, курс, оцінка).
+
+        Повертає:
+            list: Пари (student_id, курс), для яких оцінку не виставлено.
+        """
+        self.get_teacher(employee_id)
+        students = self.students
+        rejected = []
+        for student_id, course, grade in grades:
+            student = students.get(student_id)
+            if student is not None and student.is_enrolled(course):
+                student.grades[course] = grade
+                self.gradebook.record(course, student_id, student.grade_level, grade)
+            else:
+                rejected.append((student_id, course))
+        return rejected
+
+    def assign_gradebook(self, employee_id: str, gradebook) -> list:
+        """
+        Виставляє оцінки з цілого журналу за один прохід.
+
+        Аргументи:
+            employee_id (str): ID вчителя, що виставляє оцінки.
+            gradebook (Iterable[tuple[str, str, str]]): Трійки (курс, student_id, оцінка).
+
+        Повертає:
+            list: Пари (student_id, курс), для яких оцінку не виставлено.
+        """
+        return self.assign_grades(employee_id, ((student_id, course, grade) for course, student_id, grade in gradebook))
+
 # --- Демонстрація використання класів ---
-print("--- Демонстрація класів: Person, Student, Teacher ---")
-
-# Створення об'єкта Person
-print("\n--- Об'єкт Person ---")
-person1 = Person("Олена Коваль", 35, "Жінка")
-print(person1.introduce())
-print(f"Деталі: {person1.get_details()}")
-
-# Створення об'єкта Student
-print("\n--- Об'єкт Student ---")
-student1 = Student("Іван Сидоренко", 16, "Чоловік", "S001", 10)
-print(student1.introduce())
-student1.enroll_course("Математика")
-student1.enroll_course("Історія України")
-student1.enroll_course("Математика") # Спроба записатися на той самий курс
-print(f"Курси {student1.name}: {student1.list_courses()}")
-print(f"Вік {student1.name}: {student1.age}") # Доступ до успадкованого атрибута
-
-# Створення об'єкта Teacher
-print("\n--- Об'єкт Teacher ---")
-teacher1 = Teacher("Марія Іванова", 40, "Жінка", "T005", "Фізика", 25000.00)
-print(teacher1.introduce())
-print(f"Зарплата {teacher1.name}: {teacher1.salary}") # Доступ до специфічного атрибута
-teacher1.add_class_taught("10-А")
-teacher1.add_class_taught("11-Б")
-
-# Призначаємо оцінку студенту
-teacher1.assign_grade(student1, "Математика", "Відмінно")
-teacher1.assign_grade(student1, "Хімія", "Добре") # Студент не записаний на цей курс
-
-# Перевіряємо оцінки студента
-print(f"Оцінки {student1.name}: {student1.grades}") # {'Математика': 'Відмінно'}
+def main():
+    """Демонстрація роботи класів Person, Student, Teacher та SchoolRegistry."""
+    print("--- Демонстрація класів: Person, Student, Teacher ---")
+    events = EventBus()  # Спільна шина подій для осіб цієї школи
+    console = events.subscribe(ConsoleSubscriber())  # Виводимо результати операцій у консоль
+    try:
+        _demo(events)
+    finally:
+        events.unsubscribe(console)
+
+
+def _demo(events: EventBus):
+    """Сценарій демонстрації; результати операцій осіб надсилаються в events."""
+
+    # Створення об'єкта Person
+    print("\n--- Об'єкт Person ---")
+    person1 = Person("Олена Коваль", 35, "Жінка", events=events)
+    print(person1.introduce())
+    print(f"Деталі: {person1.get_details()}")
+
+    # Створення об'єкта Student
+    print("\n--- Об'єкт Student ---")
+    student1 = Student("Іван Сидоренко", 16, "Чоловік", "S001", 10, events=events)
+    print(student1.introduce())
+    student1.enroll_course("Математика")
+    student1.enroll_course("Історія України")
+    student1.enroll_course("Математика") # Спроба записатися на той самий курс
+    print(f"Курси {student1.name}: {student1.list_courses()}")
+    # Список курсів — копія: зміна повернутого списку не розходиться з перевіркою запису
+    student1.list_courses().append("Хімія")
+    assert not student1.is_enrolled("Хімія") and student1.courses == ("Математика", "Історія України")
+    # courses лише для читання: спроба змінити його напряму — помилка, а не тихе ігнорування
+    try:
+        student1.courses.append("Хімія")
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("courses має бути лише для читання")
+    print(f"Вік {student1.name}: {student1.age}") # Доступ до успадкованого атрибута
+
+    # Створення об'єкта Teacher
+    print("\n--- Об'єкт Teacher ---")
+    teacher1 = Teacher("Марія Іванова", 40, "Жінка", "T005", "Фізика", 25000.00, events=events)
+    print(teacher1.introduce())
+    print(f"Зарплата {teacher1.name}: {teacher1.salary}") # Доступ до специфічного атрибута
+    teacher1.add_class_taught("10-А")
+    teacher1.add_class_taught("11-Б")
+
+    # Призначаємо оцінку студенту
+    teacher1.assign_grade(student1, "Математика", "Відмінно")
+    teacher1.assign_grade(student1, "Хімія", "Добре") # Студент не записаний на цей курс
+
+    # Перевіряємо оцінки студента
+    print(f"Оцінки {student1.name}: {student1.grades}") # {'Математика': 'Відмінно'}
+
+    # Реєстр школи з індексами
+    print("\n--- Реєстр школи (SchoolRegistry) ---")
+    registry = SchoolRegistry()
+    registry.add_student(student1)
+    registry.add_student(Student("Олег Бондар", 15, "Чоловік", "S002", 9, events=events))
+    registry.add_teacher(teacher1)
+    registry.enroll_many([("S002", "Математика"), ("S002", "Фізика")])
+    print(f"Учні курсу 'Математика': {[s.name for s in registry.students_in_course('Математика')]}")
+    rejected = registry.assign_grades("T005", [("S001", "Історія України", "Добре"), ("S002", "Хімія", "Добре"),
+                                               ("S404", "Фізика", "Добре"), ("S002", "Фізика", "Відмінно")])
+    print(f"Оцінки не виставлено для: {rejected}")  # [('S002', 'Хімія'), ('S404', 'Фізика')]
+    assert rejected == [('S002', 'Хімія'), ('S404', 'Фізика')]
+    assert registry.students["S002"].grades == {'Фізика': 'Відмінно'}  # рядки після невідомого ID теж виставлено
+    registry.assign_gradebook("T005", [("Математика", "S001", "Відмінно"), ("Математика", "S002", "Добре")])
+    print(f"Розподіл оцінок з математики: {registry.gradebook.course_distribution('Математика')}")
+    print(f"Середній бал з математики: {registry.gradebook.course_average('Математика')}")  # 4.5
+    print(f"Рейтинг учнів: {registry.gradebook.ranking(top=2)}")
+
+    # Особа без шини подій нічого не розсилає, а лише повертає результат
+    assert Student("Анна Мельник", 14, "Жінка", "S003", 8).enroll_course("Математика").ok
+
+if __name__ == "__main__":
+    main()
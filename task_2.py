@@ -1,41 +1,368 @@
+import math
+import os
+import sys
+from array import array
+from collections import deque
+from itertools import islice
+
+from optional_deps import load_numpy
+
+
 class Mathematician:
+    """
+    Методи приймають списки (і повертають списки), а також масиви NumPy, array.array
+    та інші об'єкти з буферним протоколом — тоді результат має той самий вигляд,
+    а обчислення виконуються векторно через маски NumPy.
+
+    leap_years_range=(перший рік, останній рік) вмикає заздалегідь обчислену таблицю
+    високосних років для цього діапазону; роки поза ним перевіряються арифметично.
+    """
+
+    def __init__(self, leap_years_range: tuple = None):
+        self._leap_table = None
+        if leap_years_range is not None:
+            self.build_leap_table(*leap_years_range)
+
+    def build_leap_table(self, first_year: int, last_year: int):
+        """Обчислює таблицю рік -> чи високосний для років first_year..last_year включно."""
+        if not isinstance(first_year, int) or not isinstance(last_year, int) or first_year > last_year:
+            raise ValueError("Діапазон років має бути парою цілих чисел (перший <= останній).")
+        self._leap_table = {
+            year: (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
+            for year in range(first_year, last_year + 1)
+        }
 
     def square_nums(self, nums: list) -> list:
 
-        return list(map(lambda x: x ** 2, nums))
+        if not _is_vector(nums):
+            return list(map(lambda x: x ** 2, nums))
+        return _vectorized(nums, _square_checked, lambda values: [x ** 2 for x in values])
 
     def remove_positives(self, nums: list) -> list:
 
-        return [num for num in nums if num <= 0] # Включає нуль, якщо він є
+        if not _is_vector(nums):
+            return [num for num in nums if num <= 0] # Включає нуль, якщо він є
+        return _vectorized(nums, lambda values: values[values <= 0], lambda values: [x for x in values if x <= 0])
 
     def filter_leaps(self, dates: list) -> list:
 
+        if _is_vector(dates):
+            return _vectorized(dates, lambda years: years[_leap_mask(years)],
+                               lambda years: [y for y in years if (y % 4 == 0 and y % 100 != 0) or y % 400 == 0])
+
+        if self._leap_table is not None:
+            return list(self.iter_leaps(dates))
+
         leap_years = []
         for year in dates:
             if (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0):
                 leap_years.append(year)
         return leap_years
 
+    def iter_leaps(self, dates):
+        """
+        Ліниво повертає високосні роки з будь-якого ітерованого джерела по одному,
+        не зберігаючи результат у списку. Якщо побудовано таблицю високосних років,
+        роки з її діапазону перевіряються одним зверненням до таблиці.
+        """
+        if self._leap_table is None:
+            for year in dates:
+                if (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0):
+                    yield year
+            return
+
+        lookup = self._leap_table.get
+        for year in dates:
+            is_leap = lookup(year)
+            if is_leap is None:  # рік поза діапазоном таблиці
+                is_leap = (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
+            if is_leap:
+                yield year
+
+
+class ParallelMathematician(Mathematician):
+    """
+    Mathematician, що розбиває великі вхідні дані на частини по chunk_size елементів
+    і обробляє їх у пулі з workers процесів, зберігаючи порядок результатів.
+    - Масиви (array.array, NumPy, буфери) один раз копіюються у спільну пам'ять,
+      а процеси читають свої частини звідти без серіалізації вхідних даних.
+    - Списки (а також кортежі, range та інші колекції — їх спершу перетворено на список)
+      розбиваються на частини й передаються процесам звичайним способом;
+      до chunk_size елементів обробляються в поточному процесі.
+    - Ітератори й генератори обробляються потоково: у роботі одночасно не більше
+      2 * workers частин, а метод повертає генератор результатів, тож дані можуть
+      бути більшими за оперативну пам'ять.
+    Таблиця високосних років (leap_years_range або build_leap_table) будується й у кожному
+    процесі пулу під час його запуску.
+    """
+
+    def __init__(self, workers: int = None, chunk_size: int = 1_000_000, leap_years_range: tuple = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._executor = None
+        self._leap_years_range = None
+        super().__init__(leap_years_range)
+
+    def build_leap_table(self, first_year: int, last_year: int):
+        super().build_leap_table(first_year, last_year)
+        self._leap_years_range = (first_year, last_year)
+        # Процеси вже запущеного пулу мають стару таблицю — наступний виклик запустить новий пул
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def square_nums(self, nums):
+        return self._run('square_nums', nums)
+
+    def remove_positives(self, nums):
+        return self._run('remove_positives', nums)
+
+    def filter_leaps(self, dates):
+        return self._run('filter_leaps', dates)
+
+    def _pool(self):
+        if self._executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+            from multiprocessing import resource_tracker
+
+            # Процеси пулу мають успадкувати трекер спільної пам'яті батька, а не запускати власні,
+            # інакше після завершення вони вважатимуть уже звільнені блоки _run_shared втраченими
+            resource_tracker.ensure_running()
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                 initargs=(self._leap_years_range,))
+        return self._executor
+
+    def _run(self, method_name: str, values):
+        if not isinstance(values, list):
+            if _is_vector(values):
+                return self._run_shared(method_name, values)
+            if iter(values) is values:  # ітератор чи генератор — читаємо потоково
+                return self._stream(method_name, values)
+            values = list(values)
+        if len(values) <= self.chunk_size:
+            return getattr(Mathematician, method_name)(self, values)
+        chunks = (values[i:i + self.chunk_size] for i in range(0, len(values), self.chunk_size))
+        return [x for chunk in self._ordered(method_name, chunks) for x in chunk]
+
+    def _ordered(self, method_name: str, chunks):
+        """Обробляє частини у пулі з обмеженим вікном і повертає результати в порядку надходження."""
+        window = deque()
+        for chunk in chunks:
+            window.append(self._pool().submit(_process_chunk, method_name, chunk))
+            if len(window) >= 2 * self.workers:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+
+    def _stream(self, method_name: str, values):
+        iterator = iter(values)
+        chunks = iter(lambda: list(islice(iterator, self.chunk_size)), [])
+        for chunk in self._ordered(method_name, chunks):
+            yield from chunk
+
+    def _run_shared(self, method_name: str, values):
+        from multiprocessing import shared_memory
+
+        np = load_numpy()
+        is_ndarray = np is not None and isinstance(values, np.ndarray)
+        source = memoryview(values)
+        typecode = values.dtype.char if is_ndarray else source.format
+        count = source.nbytes // source.itemsize  # елементів, а не рядків багатовимірного масиву
+        # Спільна пам'ять читається як суцільний array.array: решту віддаємо Mathematician
+        if (count <= self.chunk_size or not source.c_contiguous or typecode not in _ARRAY_TYPECODES
+                or (not is_ndarray and source.ndim != 1)):
+            return getattr(Mathematician, method_name)(self, values)
+
+        shm = shared_memory.SharedMemory(create=True, size=source.nbytes)
+        try:
+            shm.buf[:source.nbytes] = source.cast('B')
+            futures = [
+                self._pool().submit(_process_shared_chunk, method_name, shm.name, typecode,
+                                    start, min(start + self.chunk_size, count))
+                for start in range(0, count, self.chunk_size)
+            ]
+            result = array(typecode)
+            for future in futures:
+                result.extend(future.result())
+        finally:
+            shm.close()
+            shm.unlink()
+
+        if is_ndarray:
+            result = np.frombuffer(result, dtype=values.dtype)
+            # Квадрати зберігають форму вхідного масиву, як і у Mathematician
+            return result.reshape(values.shape) if method_name == 'square_nums' else result
+        return result if isinstance(values, array) else memoryview(result)
+
+
+# --- Функції, що виконуються у процесах пулу ---
+_worker_mathematician = Mathematician()
+
+
+def _init_worker(leap_years_range: tuple):
+    global _worker_mathematician
+    _worker_mathematician = Mathematician(leap_years_range)
+
+
+def _process_chunk(method_name: str, chunk):
+    return getattr(_worker_mathematician, method_name)(chunk)
+
+
+def _process_shared_chunk(method_name: str, shm_name: str, typecode: str, start: int, stop: int) -> array:
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        values = array(typecode)
+        with shm.buf[start * values.itemsize:stop * values.itemsize] as chunk:
+            values.frombytes(chunk)
+    finally:
+        shm.close()
+    return getattr(_worker_mathematician, method_name)(values)
+
+
+# --- Допоміжні функції для масивів ---
+_ARRAY_TYPECODES = frozenset('bBhHiIlLqQfd')  # числові типи array.array
+
+
+def _leap_mask(years):
+    # 400 не вміщується у вузькі цілі типи (int8, uint8): рахуємо маску на розширеному поданні
+    np = load_numpy()
+    if years.dtype.kind in 'iu':
+        years = years.astype(np.int64 if years.dtype.kind == 'i' else np.uint64, copy=False)
+    return ((years % 4 == 0) & (years % 100 != 0)) | (years % 400 == 0)
+
+
+def _square_checked(values):
+    """
+    Підносить масив NumPy до квадрата без тихого переповнення: якщо результат не вміщується
+    в тип елементів, піднімає OverflowError — так само, як array.array без NumPy.
+    """
+    np = load_numpy()
+    if values.dtype.kind in 'iu':
+        # x² вміщується в тип, лише якщо |x| <= isqrt(максимуму типу); перевіряємо до множення
+        limit = math.isqrt(int(np.iinfo(values.dtype).max))
+        if values.size and (int(values.max()) > limit or int(values.min()) < -limit):
+            raise OverflowError(f"Квадрат числа не вміщується в тип елементів '{values.dtype}'.")
+        return values * values
+    with np.errstate(over='raise'):
+        try:
+            return values ** 2
+        except FloatingPointError as e:
+            raise OverflowError(f"Квадрат числа не вміщується в тип елементів '{values.dtype}'.") from e
+
+
+def _is_vector(values) -> bool:
+    """Чи є values масивом NumPy або об'єктом з буферним протоколом (array.array, memoryview, ...)."""
+    # bytes і bytearray обробляються як послідовності чисел і повертають список, як і раніше
+    if isinstance(values, (list, bytes, bytearray)):
+        return False
+    # Якщо NumPy ще не імпортовано, values не може бути масивом NumPy — не завантажуємо його даремно
+    np = sys.modules.get('numpy')
+    if np is not None and isinstance(values, np.ndarray):
+        return True
+    try:
+        memoryview(values)
+    except TypeError:
+        return False
+    return True
+
+
+def _vectorized(values, numpy_op, python_op):
+    """
+    Застосовує numpy_op до values як до масиву NumPy (без копіювання буфера)
+    і повертає результат того ж виду, що й вхідні дані.
+    Без NumPy використовує python_op над елементами.
+    """
+    np = load_numpy()
+    if np is not None and isinstance(values, np.ndarray):
+        return numpy_op(values)
+
+    if isinstance(values, array):
+        typecode = values.typecode
+    else:
+        typecode = memoryview(values).format
+
+    if np is not None:
+        result = numpy_op(np.frombuffer(values, dtype=typecode)).astype(typecode, copy=False)
+        result = array(typecode, result.tobytes())
+    else:
+        result = array(typecode, python_op(values if isinstance(values, array) else memoryview(values)))
+    return result if isinstance(values, array) else memoryview(result)
+
+
+# --- Демонстрація та перевірки ---
+def main():
+    """Демонстрація та перевірки класу Mathematician."""
+    print("\n--- Демонстрація класу Mathematician ---")
+    m = Mathematician()
+
+    # Перевірка square_nums
+    nums_to_square = [7, 11, 5, 4]
+    squared_result = m.square_nums(nums_to_square)
+    print(f"Квадрати чисел {nums_to_square}: {squared_result}")
+    assert squared_result == [49, 121, 25, 16]
+
+    # Перевірка remove_positives
+    nums_to_filter = [26, -11, -8, 13, -90]
+    filtered_result = m.remove_positives(nums_to_filter)
+    print(f"Числа без додатних {nums_to_filter}: {filtered_result}")
+    assert filtered_result == [-11, -8, -90]
+
+    # Перевірка filter_leaps
+    years_to_check = [2001, 1884, 1995, 2003, 2020]
+    leap_years_result = m.filter_leaps(years_to_check)
+    print(f"Високосні роки з {years_to_check}: {leap_years_result}")
+    assert leap_years_result == [1884, 2020]
+
+    # Ті самі методи над array.array повертають array.array того ж типу
+    leap_array_result = m.filter_leaps(array('i', years_to_check))
+    print(f"Високосні роки з array('i', ...): {leap_array_result}")
+    assert leap_array_result == array('i', [1884, 2020])
+
+    # Переповнення типу масиву — помилка, а не тихе обрізання значення (з NumPy і без нього)
+    try:
+        m.square_nums(array('i', [50000]))
+    except OverflowError:
+        pass
+    else:
+        raise AssertionError("очікувалось OverflowError")
+    assert m.square_nums(b'\x02\x10') == [4, 256]
+    assert m.filter_leaps(array('b', [4, 5, 8, -4])) == array('b', [4, 8, -4])  # 400 не вміщується в int8
 
-print("\n--- Демонстрація класу Mathematician ---")
-m = Mathematician()
+    # Таблиця високосних років і ліниве фільтрування
+    m_with_table = Mathematician(leap_years_range=(1900, 2100))
+    assert m_with_table.filter_leaps(years_to_check + [1600, 2400]) == [1884, 2020, 1600, 2400]
+    leap_years_iter = m_with_table.iter_leaps(year for year in years_to_check)
+    print(f"Перший високосний рік з генератора: {next(leap_years_iter)}")
 
-# Перевірка square_nums
-nums_to_square = [7, 11, 5, 4]
-squared_result = m.square_nums(nums_to_square)
-print(f"Квадрати чисел {nums_to_square}: {squared_result}")
-assert squared_result == [49, 121, 25, 16]
+    # Паралельна обробка: таблиця високосних років передається процесам пулу
+    with ParallelMathematician(workers=2, chunk_size=2, leap_years_range=(1900, 2100)) as pm:
+        assert pm.filter_leaps(years_to_check + [1600, 2400]) == [1884, 2020, 1600, 2400]
+        # Кортежі й range — не потоки: результат список, як і в Mathematician
+        assert pm.square_nums((1, 2, 3)) == [1, 4, 9] and pm.filter_leaps(range(1999, 2005)) == [2000, 2004]
+        assert list(pm.remove_positives(x for x in (-1, 2, 0))) == [-1, 0]
+        # Масиви йдуть через спільну пам'ять; багатовимірні зберігають форму, а несуцільні
+        # та типи без коду array.array обробляються як у Mathematician
+        assert pm.square_nums(array('i', range(5))) == array('i', [0, 1, 4, 9, 16])
+        np = load_numpy()
+        if np is not None:
+            grid = np.arange(12).reshape(4, 3)
+            assert (pm.square_nums(grid) == grid ** 2).all()
+            assert (pm.square_nums(np.arange(20)[::2]) == np.arange(20)[::2] ** 2).all()
+            assert pm.square_nums(np.arange(5, dtype=np.float16)).tolist() == [0, 1, 4, 9, 16]
 
-# Перевірка remove_positives
-nums_to_filter = [26, -11, -8, 13, -90]
-filtered_result = m.remove_positives(nums_to_filter)
-print(f"Числа без додатних {nums_to_filter}: {filtered_result}")
-assert filtered_result == [-11, -8, -90]
+    print("\nВсі демонстрації класів пройшли успішно!")
 
-# Перевірка filter_leaps
-years_to_check = [2001, 1884, 1995, 2003, 2020]
-leap_years_result = m.filter_leaps(years_to_check)
-print(f"Високосні роки з {years_to_check}: {leap_years_result}")
-assert leap_years_result == [1884, 2020]
 
-print("\nВсі демонстрації класів пройшли успішно!")
+if __name__ == "__main__":
+    main()
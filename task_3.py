@@ -1,9 +1,18 @@
-from typing import Union
+import gc
+import time
+from itertools import islice
+
+from campaigns import Campaign, CampaignSchedule
+from events import ConsoleSubscriber, CounterSubscriber, EventBus, OperationResult
+from money import cents_to_decimal, unit_price_cents
+from stock_tracking import StockTracker
 
 class Product:
     """
     Представляє окремий продукт з типом, назвою та базовою ціною.
     """
+    # __slots__ замість __dict__ у кожному екземплярі: менше пам'яті на великих каталогах
+    __slots__ = ('type', 'name', 'price')
 
     def __init__(self, type: str, name: str, price: float):
         """
@@ -25,6 +34,15 @@ class Product:
         self.name = name
         self.price = price  # Базова ціна
 
+    @classmethod
+    def _trusted(cls, type: str, name: str, price: float) -> 'Product':
+        """Створює продукт без перевірок — лише для вже перевірених даних (ProductStore.from_records)."""
+        product = cls.__new__(cls)
+        product.type = type
+        product.name = name
+        product.price = price
+        return product
+
     def __repr__(self):
         """Повертає строкове представлення об'єкта Product."""
         return f"Product(type='{self.type}', name='{self.name}', price={self.price})"
@@ -36,17 +54,113 @@ class ProductStore:
     """
     # Преміум націнка для всіх продуктів у магазині (30%)
     PRICE_PREMIUM_FACTOR = 1.30
+    # Поля, які повертають get_all_products, iter_products та export_products
+    PRODUCT_FIELDS = ('name', 'type', 'amount', 'unit_price_with_premium_and_discount')
 
-    def __init__(self):
+    def __init__(self, accounting: str = 'float', events: EventBus = None):
         """
         Ініціалізує ProductStore з порожнім асортиментом та нульовим доходом.
         self.products: словник, де ключ - назва продукту,
                        значення - словник з {'product_obj': Product, 'amount': int, 'discount_percent': float}
+
+        Аргументи:
+            accounting (str): 'float' — дохід лише у float (self.income);
+                              'cents' — додатково точний облік у цілих копійках з лічильниками
+                              доходу за продуктами й типами (get_income_exact, get_revenue).
+            events (EventBus): Шина подій для результатів операцій цього магазину; без неї
+                               створюється власна. Без підписників методи нічого не виводять.
         """
+        if accounting not in ('float', 'cents'):
+            raise ValueError("accounting має бути 'float' або 'cents'.")
+        self.accounting = accounting
+        self.events = events if events is not None else EventBus()
         self.products = {}  # Агрегація/композиція: ProductStore містить об'єкти Product
         self.income = 0.0
+        # Точний облік (accounting='cents'): загальний дохід і дохід за продуктами та типами в копійках
+        self.income_cents = 0
+        self._revenue_by_product = {}
+        self._revenue_by_type = {}
+        # Вторинний індекс: тип продукту -> множина назв продуктів цього типу
+        self._names_by_type = {}
+        # Назви в порядку додавання: позиція в списку — курсор для посторінкового перегляду
+        self._product_names = []
+        # Кеш кінцевих цін за одиницю (назва -> ціна з націнкою та знижкою) та націнка, з якою він побудований
+        self._unit_prices = {}
+        self._unit_prices_cents = {}
+        self._unit_prices_premium = self.PRICE_PREMIUM_FACTOR
+        # Тимчасові кампанії знижок (див. add_campaign)
+        self.campaigns = CampaignSchedule()
+        # Індекси залишків і продажів (див. track_stock); None — відстеження вимкнено
+        self.stock = None
+
+    @classmethod
+    def from_records(cls, records, validate: str = 'schema', events: EventBus = None) -> 'ProductStore':
+        """
+        Створює магазин з готового каталогу одним проходом, без виклику add() для кожного рядка.
+        Повторні назви підсумовують кількість, як і add().
 
-    def add(self, product: Product, amount: int):
+        Аргументи:
+            records: Ітерований об'єкт кортежів (type, name, price, amount).
+            validate (str): 'schema' — перевірити всі записи до побудови магазину
+                            (при першій помилці магазин не створюється, у повідомленні номер запису);
+                            'none' — не перевіряти (для довірених, підписаних вивантажень).
+            events (EventBus): Шина подій нового магазину (див. __init__).
+        """
+        if validate not in ('schema', 'none'):
+            raise ValueError("validate має бути 'schema' або 'none'.")
+        if validate == 'schema':
+            records = cls._validated_records(records)
+
+        store = cls(events=events)
+        products = store.products
+        names_by_type = store._names_by_type
+        product_names = store._product_names
+        new_product = Product._trusted
+        # Під час створення мільйонів нових об'єктів збирач сміття запускався б раз у раз,
+        # хоча циклічних посилань тут немає, тож на час завантаження його вимкнено
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for product_type, name, price, amount in records:
+                product_data = products.get(name)
+                if product_data is not None:
+                    product_data['amount'] += amount
+                    continue
+                products[name] = {'product_obj': new_product(product_type, name, price), 'amount': amount,
+                                  'discount_percent': 0.0}
+                product_names.append(name)
+                names = names_by_type.get(product_type)
+                if names is None:
+                    names = names_by_type[product_type] = set()
+                names.add(name)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        store.events.emit(OperationResult(
+            'bulk_loaded', True, "Завантажено каталог, продуктів: {count}.", count=len(products)))
+        return store
+
+    @staticmethod
+    def _validated_records(records) -> list:
+        """Перевіряє всі записи за один прохід і повертає їх списком."""
+        records = list(records)
+        for index, record in enumerate(records):
+            try:
+                product_type, name, price, amount = record
+            except (TypeError, ValueError):
+                raise ValueError(f"Запис {index}: очікується (type, name, price, amount).") from None
+            if not isinstance(product_type, str) or not product_type:
+                raise ValueError(f"Запис {index}: тип продукту має бути непорожнім рядком.")
+            if not isinstance(name, str) or not name:
+                raise ValueError(f"Запис {index}: назва продукту має бути непорожнім рядком.")
+            if not isinstance(price, (int, float)) or price <= 0:
+                raise ValueError(f"Запис {index}: ціна продукту має бути додатним числом.")
+            if not isinstance(amount, int) or amount <= 0:
+                raise ValueError(f"Запис {index}: кількість продукту має бути додатним цілим числом.")
+        return records
+
+    def add(self, product: Product, amount: int) -> OperationResult:
         """
         Додає вказану кількість продукту до магазину.
         Застосовує націнку магазину до ціни продукту.
@@ -63,8 +177,11 @@ class ProductStore:
         if product.name in self.products:
             # Якщо продукт вже є, просто оновлюємо кількість
             self.products[product.name]['amount'] += amount
-            print(
-                f"Додано {amount} одиниць '{product.name}'. Загальна кількість: {self.products[product.name]['amount']}")
+            if self.stock is not None:
+                self._stock_changed(product.name, self.products[product.name]['amount'], 0)
+            return self.events.emit(OperationResult(
+                'added', True, "Додано {amount} одиниць '{name}'. Загальна кількість: {total}",
+                name=product.name, amount=amount, total=self.products[product.name]['amount']))
         else:
             # Якщо продукт новий, додаємо його з початковою знижкою 0%
             self.products[product.name] = {
@@ -72,9 +189,16 @@ class ProductStore:
                 'amount': amount,
                 'discount_percent': 0.0
             }
-            print(f"Додано новий продукт '{product.name}' ({amount} одиниць).")
-
-    def set_discount(self, identifier: Union[str, int], percent: Union[int, float], identifier_type: str = 'name'):
+            self._names_by_type.setdefault(product.type, set()).add(product.name)
+            self._product_names.append(product.name)
+            if self.stock is not None:
+                self._stock_changed(product.name, amount, 0)
+            return self.events.emit(OperationResult(
+                'added', True, "Додано новий продукт '{name}' ({amount} одиниць).",
+                name=product.name, amount=amount, total=amount))
+
+    def set_discount(self, identifier: str | int, percent: int | float,
+                     identifier_type: str = 'name') -> OperationResult:
         """
         Встановлює знижку для продуктів за назвою або типом.
 
@@ -89,24 +213,67 @@ class ProductStore:
         if identifier_type not in ['name', 'type']:
             raise ValueError("identifier_type має бути 'name' або 'type'.")
 
-        found_match = False
-        for product_data in self.products.values():
-            product_obj = product_data['product_obj']
+        # Замість перебору всього асортименту звертаємося напряму до словника (за назвою)
+        # або до індексу типів (лише продукти потрібної категорії)
+        if identifier_type == 'name':
+            names = [identifier] if identifier in self.products else []
+        else:
+            names = self._names_by_type.get(identifier, ())
 
-            if identifier_type == 'name' and product_obj.name == identifier:
-                product_data['discount_percent'] = percent
-                found_match = True
-                print(f"Встановлено знижку {percent}% для продукту '{identifier}'.")
-            elif identifier_type == 'type' and product_obj.type == identifier:
-                product_data['discount_percent'] = percent
-                found_match = True
-                print(f"Встановлено знижку {percent}% для продуктів типу '{identifier}'.")
+        for name in names:
+            self.products[name]['discount_percent'] = percent
+            self._unit_prices.pop(name, None)
+            self._unit_prices_cents.pop(name, None)
 
-        if not found_match:
+        if not names:
             raise ValueError(
                 f"Продукт(и) з ідентифікатором '{identifier}' (тип: {identifier_type}) не знайдено для встановлення знижки.")
 
-    def sell_product(self, product_name: str, amount: int):
+        if identifier_type == 'name':
+            template = "Встановлено знижку {percent}% для продукту '{identifier}'."
+        else:
+            template = "Встановлено знижку {percent}% для продуктів типу '{identifier}' ({count} шт.)."
+        return self.events.emit(OperationResult(
+            'discount_set', True, template, identifier=identifier, identifier_type=identifier_type,
+            percent=percent, count=len(names)))
+
+    def add_campaign(self, identifier: str, percent: int | float, start: float, end: float,
+                     identifier_type: str = 'name', priority: int = 0) -> OperationResult:
+        """
+        Планує тимчасову знижку для продукту або типу на проміжок [start, end)
+        (мітки часу в секундах, як time.time()). Поки кампанія діє, її знижка замінює
+        постійну знижку з set_discount; кампанія вмикається й вимикається сама під час
+        читання цін, без перебору асортименту. Правила вибору серед кількох кампаній
+        описані в CampaignSchedule. Продукт чи тип можуть ще бути відсутніми в магазині.
+
+        Аргументи:
+            identifier (str): Назва продукту або тип продукту.
+            percent (int | float): Розмір знижки у відсотках (від 0 до 100).
+            start (float): Початок дії кампанії.
+            end (float): Кінець дії кампанії (має бути пізніше за start).
+            identifier_type (str): Тип ідентифікатора ('name' або 'type').
+            priority (int): Пріоритет серед кампаній, що перетинаються.
+        """
+        if not isinstance(percent, (int, float)) or not (0 <= percent <= 100):
+            raise ValueError("Відсоток знижки має бути від 0 до 100.")
+        if identifier_type not in ['name', 'type']:
+            raise ValueError("identifier_type має бути 'name' або 'type'.")
+        if not isinstance(start, (int, float)) or not isinstance(end, (int, float)) or start >= end:
+            raise ValueError("Кампанія має починатися раніше, ніж закінчується.")
+
+        campaign = self.campaigns.add(identifier, identifier_type, percent, start, end, priority)
+        return self.events.emit(OperationResult(
+            'campaign_added', True, "Заплановано знижку {percent}% для '{identifier}' ({identifier_type}).",
+            identifier=identifier, identifier_type=identifier_type, percent=percent, campaign=campaign))
+
+    def cancel_campaign(self, campaign: Campaign) -> OperationResult:
+        """Скасовує кампанію (заплановану чи активну), повернуту add_campaign у result.data['campaign']."""
+        self.campaigns.cancel(campaign)
+        return self.events.emit(OperationResult(
+            'campaign_cancelled', True, "Скасовано знижку {percent}% для '{identifier}'.",
+            identifier=campaign.identifier, percent=campaign.percent, campaign=campaign))
+
+    def sell_product(self, product_name: str, amount: int) -> OperationResult:
         """
         Продає вказану кількість продукту зі складу.
         Збільшує дохід магазину.
@@ -125,21 +292,142 @@ class ProductStore:
 
         product_data = self.products[product_name]
         current_amount = product_data['amount']
-        product_obj = product_data['product_obj']
-        discount_percent = product_data['discount_percent']
 
         if current_amount < amount:
             raise ValueError(f"Недостатньо '{product_name}' на складі. Доступно: {current_amount}, запитано: {amount}.")
 
-        # Обчислення ціни продажу за одиницю
-        # Базова ціна -> Ціна з націнкою -> Ціна зі знижкою
-        price_after_premium = product_obj.price * self.PRICE_PREMIUM_FACTOR
-        final_unit_price = price_after_premium * (1 - discount_percent / 100)
+        # Ціна продажу за одиницю береться з кеша
+        final_unit_price = self._unit_price(product_name)
 
         # Оновлення кількості та доходу
         product_data['amount'] -= amount
         self.income += final_unit_price * amount
-        print(f"Продано {amount} одиниць '{product_name}' за {final_unit_price:.2f} за одиницю. Дохід збільшено.")
+        if self.accounting == 'cents':
+            self._add_revenue(product_name, self._unit_price_cents(product_name) * amount)
+        if self.stock is not None:
+            self._stock_changed(product_name, product_data['amount'], amount)
+        return self.events.emit(OperationResult(
+            'sold', True, "Продано {amount} одиниць '{name}' за {unit_price:.2f} за одиницю. Дохід збільшено.",
+            name=product_name, amount=amount, unit_price=final_unit_price))
+
+    def sell_many(self, orders) -> list:
+        """
+        Продає одразу цілий кошик продуктів за принципом "все або нічого".
+        Спочатку перевіряє всі рядки та наявність на складі, і лише потім списує товар,
+        тому при будь-якій помилці склад і дохід залишаються незмінними.
+
+        Аргументи:
+            orders (Iterable[tuple[str, int]] | dict): Пари (назва продукту, кількість)
+                                                      або кошик у вигляді словника {назва: кількість}.
+
+        Повертає:
+            list: Список кортежів (назва продукту, кількість, сума за рядок) у порядку замовлення.
+        """
+        if isinstance(orders, dict):
+            orders = orders.items()
+        lines = list(orders)
+
+        # Перевірка всього кошика за один прохід; однакові продукти сумуються
+        requested = {}
+        for product_name, amount in lines:
+            if not isinstance(product_name, str) or not product_name:
+                raise ValueError("Назва продукту має бути непорожнім рядком.")
+            if not isinstance(amount, int) or amount <= 0:
+                raise ValueError("Кількість для продажу має бути додатним цілим числом.")
+            if product_name not in self.products:
+                raise ValueError(f"Продукту '{product_name}' немає в наявності.")
+            requested[product_name] = requested.get(product_name, 0) + amount
+
+        for product_name, amount in requested.items():
+            current_amount = self.products[product_name]['amount']
+            if current_amount < amount:
+                raise ValueError(
+                    f"Недостатньо '{product_name}' на складі. Доступно: {current_amount}, запитано: {amount}.")
+
+        # Ціна за одиницю береться з кеша один раз для кожного продукту в кошику
+        unit_prices = {}
+        for product_name, amount in requested.items():
+            unit_prices[product_name] = self._unit_price(product_name)
+            self.products[product_name]['amount'] -= amount
+
+        line_totals = [(product_name, amount, unit_prices[product_name] * amount) for product_name, amount in lines]
+        batch_total = sum(total for _, _, total in line_totals)
+        self.income += batch_total
+        if self.accounting == 'cents':
+            for product_name, amount in requested.items():
+                self._add_revenue(product_name, self._unit_price_cents(product_name) * amount)
+        if self.stock is not None:
+            for product_name, amount in requested.items():
+                self._stock_changed(product_name, self.products[product_name]['amount'], amount)
+        self.events.emit(OperationResult(
+            'basket_sold', True, "Продано кошик з {lines} позицій на суму {total:.2f}. Дохід збільшено.",
+            lines=len(line_totals), total=batch_total))
+        return line_totals
+
+    def set_premium_factor(self, factor: float):
+        """
+        Змінює націнку магазину для цього екземпляра та скидає кеш цін.
+
+        Аргументи:
+            factor (float): Новий множник націнки (наприклад, 1.30 для 30%).
+        """
+        if not isinstance(factor, (int, float)) or factor <= 0:
+            raise ValueError("Націнка має бути додатним числом.")
+        self.PRICE_PREMIUM_FACTOR = factor
+        self._unit_prices.clear()
+        self._unit_prices_cents.clear()
+        self._unit_prices_premium = factor
+
+    def _unit_price(self, product_name: str) -> float:
+        """
+        Повертає кінцеву ціну за одиницю (базова ціна -> націнка -> знижка) з кеша,
+        обчислюючи її лише при першому зверненні після зміни знижки чи націнки.
+        Зміна PRICE_PREMIUM_FACTOR напряму (у класі чи екземплярі) також скидає кеш.
+        Ціна з активною кампанією не кешується: кампанія може закінчитися будь-якої миті.
+        """
+        if self._unit_prices_premium != self.PRICE_PREMIUM_FACTOR:
+            self._unit_prices.clear()
+            self._unit_prices_cents.clear()
+            self._unit_prices_premium = self.PRICE_PREMIUM_FACTOR
+
+        if self.campaigns:
+            product = self.products[product_name]['product_obj']
+            percent = self.campaigns.percent_for(product_name, product.type)
+            if percent is not None:
+                return product.price * self.PRICE_PREMIUM_FACTOR * (1 - percent / 100)
+
+        final_unit_price = self._unit_prices.get(product_name)
+        if final_unit_price is None:
+            product_data = self.products[product_name]
+            price_after_premium = product_data['product_obj'].price * self.PRICE_PREMIUM_FACTOR
+            final_unit_price = price_after_premium * (1 - product_data['discount_percent'] / 100)
+            self._unit_prices[product_name] = final_unit_price
+        return final_unit_price
+
+    def _unit_price_cents(self, product_name: str) -> int:
+        """
+        Повертає ціну за одиницю в цілих копійках (правило округлення — money.unit_price_cents)
+        з окремого кеша, який скидається разом з кешем _unit_price.
+        Викликається після _unit_price, тож кеш уже узгоджений з поточною націнкою.
+        """
+        cents = self._unit_prices_cents.get(product_name)
+        if cents is not None:
+            return cents
+        product_data = self.products[product_name]
+        product = product_data['product_obj']
+        percent = self.campaigns.percent_for(product_name, product.type) if self.campaigns else None
+        if percent is not None:
+            return unit_price_cents(product.price, self.PRICE_PREMIUM_FACTOR, percent)
+        cents = unit_price_cents(product.price, self.PRICE_PREMIUM_FACTOR, product_data['discount_percent'])
+        self._unit_prices_cents[product_name] = cents
+        return cents
+
+    def _add_revenue(self, product_name: str, cents: int):
+        """Додає суму продажу в копійках до загального доходу та лічильників продукту й типу."""
+        self.income_cents += cents
+        self._revenue_by_product[product_name] = self._revenue_by_product.get(product_name, 0) + cents
+        product_type = self.products[product_name]['product_obj'].type
+        self._revenue_by_type[product_type] = self._revenue_by_type.get(product_type, 0) + cents
 
     def get_income(self) -> float:
         """
@@ -147,6 +435,73 @@ class ProductStore:
         """
         return self.income
 
+    def get_income_exact(self) -> 'Decimal':
+        """Повертає точний загальний дохід (лише для accounting='cents')."""
+        self._require_cents()
+        return cents_to_decimal(self.income_cents)
+
+    def get_revenue(self, identifier: str, identifier_type: str = 'name') -> 'Decimal':
+        """
+        Повертає точний дохід від продукту або типу продуктів за O(1) (лише для accounting='cents').
+
+        Аргументи:
+            identifier (str): Назва продукту або тип продукту.
+            identifier_type (str): Тип ідентифікатора ('name' або 'type').
+        """
+        self._require_cents()
+        if identifier_type not in ['name', 'type']:
+            raise ValueError("identifier_type має бути 'name' або 'type'.")
+        revenue = self._revenue_by_product if identifier_type == 'name' else self._revenue_by_type
+        return cents_to_decimal(revenue.get(identifier, 0))
+
+    def get_revenue_by_type(self) -> dict:
+        """Повертає словник тип продукту -> точний дохід (лише для accounting='cents')."""
+        self._require_cents()
+        return {product_type: cents_to_decimal(cents) for product_type, cents in self._revenue_by_type.items()}
+
+    def track_stock(self, reorder_level: int = None) -> StockTracker:
+        """
+        Вмикає інкрементні індекси залишків і продажів (StockTracker), які далі оновлюються
+        в add, sell_product та sell_many. Продажі до виклику в top_sellers не враховуються.
+        Події 'reorder' про зниження залишку до рівня дозамовлення надсилаються в self.events.
+
+        Аргументи:
+            reorder_level (int): Рівень дозамовлення для всіх продуктів (None — без сповіщень);
+                                 для окремих продуктів його можна змінити через stock.set_reorder_level.
+        """
+        self.stock = StockTracker(reorder_level, events=self.events)
+        self.stock.load({name: product_data['amount'] for name, product_data in self.products.items()})
+        return self.stock
+
+    def _stock_changed(self, product_name: str, amount: int, sold: int):
+        """Передає новий залишок (і кількість проданих одиниць) у StockTracker."""
+        self.stock.update(product_name, amount, sold)
+
+    def low_stock(self, threshold: int) -> list:
+        """
+        Повертає [(назва, кількість)] продуктів із залишком не більше threshold, від найменшого,
+        без сортування всього асортименту (потрібен track_stock).
+        """
+        self._require_stock()
+        if not isinstance(threshold, int):
+            raise ValueError("Поріг залишку має бути цілим числом.")
+        return self.stock.low_stock(threshold)
+
+    def top_sellers(self, k: int = 10) -> list:
+        """Повертає до k пар (назва, продано одиниць) від найбільших продажів (потрібен track_stock)."""
+        self._require_stock()
+        if not isinstance(k, int) or k <= 0:
+            raise ValueError("k має бути додатним цілим числом.")
+        return self.stock.top_sellers(k)
+
+    def _require_stock(self):
+        if self.stock is None:
+            raise ValueError("Відстеження залишків вимкнено: викличте track_stock().")
+
+    def _require_cents(self):
+        if self.accounting != 'cents':
+            raise ValueError("Точний облік доходу вимкнено: створіть ProductStore(accounting='cents').")
+
     def get_all_products(self) -> list:
         """
         Повертає інформацію про всі доступні продукти в магазині.
@@ -155,22 +510,121 @@ class ProductStore:
             list: Список словників, кожен з яких містить інформацію
                   про продукт (назва, тип, кількість, ціна з націнкою та знижкою).
         """
-        all_products_info = []
-        for product_name, product_data in self.products.items():
-            product_obj = product_data['product_obj']
-            amount = product_data['amount']
-            discount_percent = product_data['discount_percent']
+        return list(self.iter_products())
+
+    def iter_products(self, product_type: str = None, min_amount: int = None, max_amount: int = None,
+                      fields: tuple = None):
+        """
+        Ліниво перебирає продукти магазину, не будуючи список усього асортименту.
+
+        Аргументи:
+            product_type (str): Повертати лише продукти цього типу.
+            min_amount (int): Повертати лише продукти, яких на складі не менше min_amount.
+            max_amount (int): Повертати лише продукти, яких на складі не більше max_amount.
+            fields (tuple): Назви полів, які потрібно включити до результату (за замовчуванням усі).
+
+        Повертає:
+            Iterator[dict]: Словники з тими ж полями, що й у get_all_products.
+        """
+        for _, row in self._iter_rows(0, product_type, min_amount, max_amount, fields):
+            yield row
+
+    def get_products_page(self, limit: int = 100, cursor: int = 0, **filters) -> tuple:
+        """
+        Повертає одну сторінку асортименту для посторінкового перегляду.
+        Продукти ніколи не видаляються з магазину, тому позиція в порядку додавання
+        є стабільним курсором між викликами.
+
+        Аргументи:
+            limit (int): Максимальна кількість продуктів на сторінці.
+            cursor (int): Курсор, отриманий з попередньої сторінки (0 — перша сторінка).
+            **filters: Ті самі фільтри, що й у iter_products (product_type, min_amount, max_amount, fields).
+
+        Повертає:
+            tuple: (список продуктів, курсор наступної сторінки або None, якщо сторінок більше немає).
+        """
+        if not isinstance(limit, int) or limit <= 0:
+            raise ValueError("Розмір сторінки має бути додатним цілим числом.")
+        if not isinstance(cursor, int) or cursor < 0:
+            raise ValueError("Курсор має бути невід'ємним цілим числом.")
+
+        page = []
+        for position, row in self._iter_rows(cursor, **filters):
+            if len(page) == limit:
+                return page, position
+            page.append(row)
+        return page, None
+
+    def export_products(self, path: str, file_format: str = 'csv', chunk_size: int = 10_000, **filters) -> int:
+        """
+        Записує асортимент у файл CSV або JSON Lines частинами по chunk_size рядків,
+        тож пам'ять не залежить від розміру каталогу.
 
-            price_after_premium = product_obj.price * self.PRICE_PREMIUM_FACTOR
-            final_unit_price = price_after_premium * (1 - discount_percent / 100)
+        Аргументи:
+            path (str): Шлях до файлу.
+            file_format (str): 'csv' або 'jsonl'.
+            chunk_size (int): Кількість рядків, що записуються за один раз.
+            **filters: Ті самі фільтри, що й у iter_products (product_type, min_amount, max_amount, fields).
 
-            all_products_info.append({
+        Повертає:
+            int: Кількість записаних продуктів.
+        """
+        if file_format not in ['csv', 'jsonl']:
+            raise ValueError("file_format має бути 'csv' або 'jsonl'.")
+        import csv  # потрібні лише для експорту, тому не сповільнюють імпорт модуля
+        import json
+
+        fields = filters.get('fields') or self.PRODUCT_FIELDS
+        rows = self.iter_products(**filters)
+
+        written = 0
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            if file_format == 'csv':
+                writer = csv.DictWriter(f, fieldnames=fields)
+                writer.writeheader()
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                if file_format == 'csv':
+                    writer.writerows(chunk)
+                else:
+                    f.write(''.join(json.dumps(row, ensure_ascii=False) + '\n' for row in chunk))
+                written += len(chunk)
+        return written
+
+    def _iter_rows(self, start: int = 0, product_type: str = None, min_amount: int = None, max_amount: int = None,
+                   fields: tuple = None):
+        """
+        Перебирає продукти, починаючи з позиції start у порядку додавання,
+        і повертає пари (позиція, словник з інформацією про продукт) для тих, що пройшли фільтри.
+        Перехід до start коштує O(1) завдяки списку назв, а продукти, додані під час перебору,
+        не порушують його.
+        """
+        names = self._product_names
+        position = start
+        while position < len(names):
+            product_name = names[position]
+            position += 1
+            product_data = self.products[product_name]
+            product_obj = product_data['product_obj']
+            amount = product_data['amount']
+            if product_type is not None and product_obj.type != product_type:
+                continue
+            if min_amount is not None and amount < min_amount:
+                continue
+            if max_amount is not None and amount > max_amount:
+                continue
+
+            row = {
                 'name': product_name,
                 'type': product_obj.type,
                 'amount': amount,
-                'unit_price_with_premium_and_discount': round(final_unit_price, 2)
-            })
-        return all_products_info
+                'unit_price_with_premium_and_discount': round(self._unit_price(product_name), 2)
+            }
+            if fields is not None:
+                row = {field: row[field] for field in fields}
+            yield position - 1, row
 
     def get_product_info(self, product_name: str) -> tuple:
         """
@@ -193,80 +647,156 @@ class ProductStore:
 
 
 # --- Демонстрація та перевірки ---
-from typing import Union
-
-print("--- Демонстрація класів Product та ProductStore ---")
-
-# Створення продуктів
-p = Product('Sport', 'Football T-Shirt', 100)
-p2 = Product('Food', 'Ramen', 1.5)
-p3 = Product('Sport', 'Basketball', 50)
-p4 = Product('Electronics', 'Headphones', 200)
-
-# Створення магазину
-s = ProductStore()
-print("\nМагазин створено.")
-
-# Додавання продуктів
-print("\n--- Додавання продуктів ---")
-s.add(p, 10)  # Football T-Shirt: 100 * 1.3 = 130 за шт.
-s.add(p2, 300)  # Ramen: 1.5 * 1.3 = 1.95 за шт.
-s.add(p3, 5)  # Basketball: 50 * 1.3 = 65 за шт.
-s.add(p4, 20)  # Headphones: 200 * 1.3 = 260 за шт.
-
-# Перевірка get_product_info перед продажем
-print("\n--- Перевірка get_product_info перед продажем ---")
-assert s.get_product_info('Ramen') == ('Ramen', 300)
-print(f"Інформація про Ramen: {s.get_product_info('Ramen')}")
-
-# Продаж продукту
-print("\n--- Продаж продуктів ---")
-s.sell_product('Ramen', 10)  # Продаємо 10 Ramen
-assert s.get_product_info('Ramen') == ('Ramen', 290)
-print(f"Інформація про Ramen після продажу: {s.get_product_info('Ramen')}")
-print(f"Поточний дохід магазину: {s.get_income():.2f}")  # Очікується: 1.95 * 10 = 19.50
-
-# Спроба продати більше, ніж є
-try:
-    s.sell_product('Football T-Shirt', 100)
-except ValueError as e:
-    print(f"Успішно перехоплено помилку: {e}")  # Очікується: Недостатньо 'Football T-Shirt' на складі.
-
-# Спроба продати неіснуючий продукт
-try:
-    s.sell_product('NonExistentProduct', 1)
-except ValueError as e:
-    print(f"Успішно перехоплено помилку: {e}")  # Очікується: Продукту 'NonExistentProduct' немає в наявності.
-
-# Встановлення знижок
-print("\n--- Встановлення знижок ---")
-s.set_discount('Football T-Shirt', 10)  # Знижка 10% на Football T-Shirt
-s.set_discount('Sport', 20, identifier_type='type')  # Знижка 20% на всі продукти типу 'Sport'
-# Це перезапише 10% для Football T-Shirt
-
-# Продаж продукту зі знижкою
-print("\n--- Продаж продуктів зі знижкою ---")
-# Football T-Shirt: 100 (базова) * 1.3 (націнка) * (1 - 0.20) (знижка) = 130 * 0.8 = 104 за шт.
-s.sell_product('Football T-Shirt', 5)
-print(f"Поточний дохід магазину: {s.get_income():.2f}")  # Очікується: 19.50 + 104 * 5 = 19.50 + 520 = 539.50
-
-# Basketball: 50 (базова) * 1.3 (націнка) * (1 - 0.20) (знижка) = 65 * 0.8 = 52 за шт.
-s.sell_product('Basketball', 2)
-print(f"Поточний дохід магазину: {s.get_income():.2f}")  # Очікується: 539.50 + 52 * 2 = 539.50 + 104 = 643.50
-
-# Спроба встановити знижку на неіснуючий ідентифікатор
-try:
-    s.set_discount('InvalidType', 5, identifier_type='type')
-except ValueError as e:
-    print(f"Успішно перехоплено помилку: {e}")
-
-# Отримання інформації про всі продукти
-print("\n--- Інформація про всі продукти ---")
-all_products = s.get_all_products()
-for prod in all_products:
-    print(prod)
-
-# Перевірка кінцевого доходу
-print(f"\nКінцевий дохід магазину: {s.get_income():.2f}")
-
-print("\nВсі тести пройшли успішно!")
+def main():
+    """Демонстрація та перевірки класів Product і ProductStore."""
+
+    print("--- Демонстрація класів Product та ProductStore ---")
+    events = EventBus()
+    console = events.subscribe(ConsoleSubscriber())  # Виводимо результати операцій у консоль
+    try:
+        _demo(events)
+    finally:
+        events.unsubscribe(console)
+
+
+def _demo(events: EventBus):
+    """Сценарій демонстрації; результати операцій магазинів надсилаються в events."""
+    # Створення продуктів
+    p = Product('Sport', 'Football T-Shirt', 100)
+    p2 = Product('Food', 'Ramen', 1.5)
+    p3 = Product('Sport', 'Basketball', 50)
+    p4 = Product('Electronics', 'Headphones', 200)
+
+    # Створення магазину
+    s = ProductStore(events=events)
+    print("\nМагазин створено.")
+
+    # Додавання продуктів
+    print("\n--- Додавання продуктів ---")
+    s.add(p, 10)  # Football T-Shirt: 100 * 1.3 = 130 за шт.
+    s.add(p2, 300)  # Ramen: 1.5 * 1.3 = 1.95 за шт.
+    s.add(p3, 5)  # Basketball: 50 * 1.3 = 65 за шт.
+    s.add(p4, 20)  # Headphones: 200 * 1.3 = 260 за шт.
+
+    # Перевірка get_product_info перед продажем
+    print("\n--- Перевірка get_product_info перед продажем ---")
+    assert s.get_product_info('Ramen') == ('Ramen', 300)
+    print(f"Інформація про Ramen: {s.get_product_info('Ramen')}")
+
+    # Продаж продукту
+    print("\n--- Продаж продуктів ---")
+    s.sell_product('Ramen', 10)  # Продаємо 10 Ramen
+    assert s.get_product_info('Ramen') == ('Ramen', 290)
+    print(f"Інформація про Ramen після продажу: {s.get_product_info('Ramen')}")
+    print(f"Поточний дохід магазину: {s.get_income():.2f}")  # Очікується: 1.95 * 10 = 19.50
+
+    # Спроба продати більше, ніж є
+    try:
+        s.sell_product('Football T-Shirt', 100)
+    except ValueError as e:
+        print(f"Успішно перехоплено помилку: {e}")  # Очікується: Недостатньо 'Football T-Shirt' на складі.
+
+    # Спроба продати неіснуючий продукт
+    try:
+        s.sell_product('NonExistentProduct', 1)
+    except ValueError as e:
+        print(f"Успішно перехоплено помилку: {e}")  # Очікується: Продукту 'NonExistentProduct' немає в наявності.
+
+    # Встановлення знижок
+    print("\n--- Встановлення знижок ---")
+    s.set_discount('Football T-Shirt', 10)  # Знижка 10% на Football T-Shirt
+    s.set_discount('Sport', 20, identifier_type='type')  # Знижка 20% на всі продукти типу 'Sport'
+    # Це перезапише 10% для Football T-Shirt
+
+    # Продаж продукту зі знижкою
+    print("\n--- Продаж продуктів зі знижкою ---")
+    # Football T-Shirt: 100 (базова) * 1.3 (націнка) * (1 - 0.20) (знижка) = 130 * 0.8 = 104 за шт.
+    s.sell_product('Football T-Shirt', 5)
+    print(f"Поточний дохід магазину: {s.get_income():.2f}")  # Очікується: 19.50 + 104 * 5 = 19.50 + 520 = 539.50
+
+    # Basketball: 50 (базова) * 1.3 (націнка) * (1 - 0.20) (знижка) = 65 * 0.8 = 52 за шт.
+    s.sell_product('Basketball', 2)
+    print(f"Поточний дохід магазину: {s.get_income():.2f}")  # Очікується: 539.50 + 52 * 2 = 539.50 + 104 = 643.50
+
+    # Спроба встановити знижку на неіснуючий ідентифікатор
+    try:
+        s.set_discount('InvalidType', 5, identifier_type='type')
+    except ValueError as e:
+        print(f"Успішно перехоплено помилку: {e}")
+
+    # Отримання інформації про всі продукти
+    print("\n--- Інформація про всі продукти ---")
+    all_products = s.get_all_products()
+    for prod in all_products:
+        print(prod)
+
+    # Продаж цілого кошика однією операцією
+    print("\n--- Пакетний продаж (sell_many) ---")
+    # Ramen: 1.95 * 10 = 19.50; Headphones: 260 * 1 = 260.00
+    lines = s.sell_many([('Ramen', 10), ('Headphones', 1)])
+    assert s.get_product_info('Ramen') == ('Ramen', 280)
+    print(f"Рядки кошика: {lines}")
+
+    # Кошик, який неможливо виконати повністю, не змінює склад
+    try:
+        s.sell_many({'Ramen': 1, 'Basketball': 100})
+    except ValueError as e:
+        print(f"Успішно перехоплено помилку: {e}")
+    assert s.get_product_info('Ramen') == ('Ramen', 280)
+
+    # Посторінковий перегляд асортименту з фільтром за типом
+    print("\n--- Посторінковий перегляд (get_products_page) ---")
+    page, cursor = s.get_products_page(limit=1, product_type='Sport', fields=('name', 'amount'))
+    print(f"Перша сторінка: {page}, наступний курсор: {cursor}")
+    page, cursor = s.get_products_page(limit=1, cursor=cursor, product_type='Sport', fields=('name', 'amount'))
+    assert page == [{'name': 'Basketball', 'amount': 3}] and cursor is None
+    print(f"Друга сторінка: {page}")
+
+    # Масове завантаження готового каталогу
+    print("\n--- Масове завантаження (from_records) ---")
+    catalog = ProductStore.from_records([('Food', 'Ramen', 1.5, 10), ('Sport', 'Ball', 20, 3)], events=events)
+    assert catalog.get_product_info('Ball') == ('Ball', 3)
+    try:
+        ProductStore.from_records([('Food', 'Ramen', 1.5, 0)])
+    except ValueError as e:
+        print(f"Успішно перехоплено помилку: {e}")
+
+    # Тимчасова кампанія знижок на тип продуктів
+    print("\n--- Кампанія знижок (add_campaign) ---")
+    campaign = catalog.add_campaign('Sport', 25, start=time.time() - 1, end=time.time() + 3600,
+                                    identifier_type='type').data['campaign']
+    assert catalog.get_all_products()[1]['unit_price_with_premium_and_discount'] == 19.5
+    catalog.cancel_campaign(campaign)
+    assert catalog.get_all_products()[1]['unit_price_with_premium_and_discount'] == 26.0
+
+    # Точний облік доходу в копійках
+    print("\n--- Точний облік доходу (accounting='cents') ---")
+    exact = ProductStore(accounting='cents', events=events)
+    exact.add(Product('Food', 'Ramen', 0.1), 100_000)
+    exact.sell_many([('Ramen', 1)] * 100_000)
+    print(f"Дохід у копійках: {exact.get_income_exact()}, у float: {exact.get_income()!r}")
+    assert str(exact.get_revenue('Food', identifier_type='type')) == '13000.00'
+
+    # Залишки, лідери продажів і сповіщення про дозамовлення
+    print("\n--- Відстеження залишків (track_stock) ---")
+    s.track_stock(reorder_level=5)
+    s.sell_product('Basketball', 1)
+    print(f"Найменші залишки: {s.low_stock(10)}")
+    print(f"Лідери продажів: {s.top_sellers(3)}")
+    assert s.low_stock(10)[0] == ('Basketball', 2)
+
+    # Кожен магазин має власну шину: події іншого магазину не потрапляють до підписників цього
+    counter = CounterSubscriber()
+    other = ProductStore()
+    other.events.subscribe(counter)
+    other.add(Product('Food', 'Udon', 2), 1)
+    s.sell_product('Ramen', 1)
+    assert dict(counter.counts) == {('added', True): 1}
+
+    # Перевірка кінцевого доходу
+    print(f"\nКінцевий дохід магазину: {s.get_income():.2f}")
+
+    print("\nВсі тести пройшли успішно!")
+
+if __name__ == "__main__":
+    main()
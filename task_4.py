@@ -1,22 +1,97 @@
+import atexit
+import gc
 import os
-from typing import Union
+import threading
+from itertools import islice
+
+from campaigns import Campaign, CampaignSchedule
+from money import cents_to_decimal, unit_price_cents
+from stock_tracking import StockTracker
+
+
+# --- Фоновий журнал помилок ---
+class ErrorLogSink:
+    """
+    Журнал помилок, який не блокує потік, що викликав виняток.
+    Повідомлення складаються в буфер і записуються у файл пачками з фонового потоку:
+    коли в буфері набирається max_batch повідомлень або минає flush_interval секунд.
+    Якщо задано max_bytes, файл ротується (logs.txt -> logs.txt.1 -> ...), зберігаючи backup_count копій.
+    Перед завершенням інтерпретатора залишок буфера записується автоматично.
+    """
+    def __init__(self, path: str = 'logs.txt', max_batch: int = 1000, flush_interval: float = 0.5,
+                 max_bytes: int = 0, backup_count: int = 3):
+        self.path = path
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._buffer = []
+        self._buffer_lock = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._thread = None
+
+    def write(self, message: str):
+        with self._buffer_lock:
+            self._buffer.append(f"ERROR: {message}\n")
+            if self._thread is None:
+                # Потік запускається лише при першій помилці, а не під час імпорту
+                self._thread = threading.Thread(target=self._run, name='ErrorLogSink', daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+            if len(self._buffer) >= self.max_batch:
+                self._buffer_lock.notify()
+
+    def flush(self):
+        """Записує у файл усі повідомлення, що накопичилися в буфері."""
+        with self._io_lock:
+            with self._buffer_lock:
+                batch, self._buffer = self._buffer, []
+            if batch:
+                self._write_batch(batch)
+
+    def _run(self):
+        while True:
+            with self._buffer_lock:
+                self._buffer_lock.wait(self.flush_interval)
+            self.flush()
+
+    def _write_batch(self, batch: list):
+        data = ''.join(batch)
+        try:
+            if self.max_bytes and os.path.exists(self.path) \
+                    and os.path.getsize(self.path) + len(data.encode('utf-8')) > self.max_bytes:
+                self._rotate()
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(data)
+        except Exception:
+            pass
+
+    def _rotate(self):
+        for i in range(self.backup_count - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
 
 # --- Користувацький виняток, що логгує помилки ---
 class CustomException(Exception):
     """
     Користувацький виняток, що логгує кожне повідомлення про помилку у файл 'logs.txt'.
+    Запис виконується фоновим журналом log_sink; щоб вимкнути логування
+    (наприклад, у щільних циклах перевірок), достатньо встановити CustomException.log_sink = None.
     """
+    log_sink = ErrorLogSink('logs.txt')
+
     def __init__(self, message: str):
         super().__init__(message)
         self._log_error(message)
 
     def _log_error(self, message: str):
-        log_file = 'logs.txt'
-        try:
-            with open(log_file, 'a', encoding='utf-8') as f:
-                f.write(f"ERROR: {message}\n")
-        except Exception:
-            pass
+        if self.log_sink is not None:
+            self.log_sink.write(message)
 
 
 # --- Клас Product ---
@@ -24,6 +99,8 @@ class Product:
     """
     Представляє окремий продукт з типом, назвою та базовою ціною.
     """
+    __slots__ = ('type', 'name', 'price')
+
     def __init__(self, type: str, name: str, price: float):
         if not isinstance(type, str) or not type:
             raise CustomException("Тип продукту має бути непорожнім рядком.")
@@ -36,6 +113,14 @@ class Product:
         self.name = name
         self.price = price
 
+    @classmethod
+    def _trusted(cls, type: str, name: str, price: float) -> 'Product':
+        product = cls.__new__(cls)
+        product.type = type
+        product.name = name
+        product.price = price
+        return product
+
     def __repr__(self):
         return f"Product(type='{self.type}', name='{self.name}', price={self.price})"
 
@@ -43,10 +128,78 @@ class Product:
 # --- Клас ProductStore ---
 class ProductStore:
     PRICE_PREMIUM_FACTOR = 1.30
+    PRODUCT_FIELDS = ('name', 'type', 'amount', 'unit_price_with_premium_and_discount')
 
-    def __init__(self):
+    def __init__(self, accounting: str = 'float'):
+        # accounting='cents' додатково веде точний облік доходу в цілих копійках
+        if accounting not in ('float', 'cents'):
+            raise CustomException("accounting має бути 'float' або 'cents'.")
+        self.accounting = accounting
         self.products = {}
         self.income = 0.0
+        self.income_cents = 0
+        self._revenue_by_product = {}
+        self._revenue_by_type = {}
+        self._names_by_type = {}
+        self._product_names = []
+        self._unit_prices = {}
+        self._unit_prices_cents = {}
+        self._unit_prices_premium = self.PRICE_PREMIUM_FACTOR
+        self.campaigns = CampaignSchedule()
+        self.stock = None
+
+    @classmethod
+    def from_records(cls, records, validate: str = 'schema') -> 'ProductStore':
+        # records: (type, name, price, amount); validate='none' — лише для довірених вивантажень
+        if validate not in ('schema', 'none'):
+            raise CustomException("validate має бути 'schema' або 'none'.")
+        if validate == 'schema':
+            records = cls._validated_records(records)
+
+        store = cls()
+        products = store.products
+        names_by_type = store._names_by_type
+        product_names = store._product_names
+        new_product = Product._trusted
+        # Під час створення мільйонів нових об'єктів збирач сміття запускався б раз у раз,
+        # хоча циклічних посилань тут немає, тож на час завантаження його вимкнено
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for product_type, name, price, amount in records:
+                product_data = products.get(name)
+                if product_data is not None:
+                    product_data['amount'] += amount
+                    continue
+                products[name] = {'product_obj': new_product(product_type, name, price), 'amount': amount,
+                                  'discount_percent': 0.0}
+                product_names.append(name)
+                names = names_by_type.get(product_type)
+                if names is None:
+                    names = names_by_type[product_type] = set()
+                names.add(name)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        return store
+
+    @staticmethod
+    def _validated_records(records) -> list:
+        records = list(records)
+        for index, record in enumerate(records):
+            try:
+                product_type, name, price, amount = record
+            except (TypeError, ValueError):
+                raise CustomException(f"Запис {index}: очікується (type, name, price, amount).") from None
+            if not isinstance(product_type, str) or not product_type:
+                raise CustomException(f"Запис {index}: тип продукту має бути непорожнім рядком.")
+            if not isinstance(name, str) or not name:
+                raise CustomException(f"Запис {index}: назва продукту має бути непорожнім рядком.")
+            if not isinstance(price, (int, float)) or price <= 0:
+                raise CustomException(f"Запис {index}: ціна продукту має бути додатним числом.")
+            if not isinstance(amount, int) or amount <= 0:
+                raise CustomException(f"Запис {index}: кількість продукту має бути додатним цілим числом.")
+        return records
 
     def add(self, product: Product, amount: int):
         if not isinstance(product, Product):
@@ -62,27 +215,45 @@ class ProductStore:
                 'amount': amount,
                 'discount_percent': 0.0
             }
+            self._names_by_type.setdefault(product.type, set()).add(product.name)
+            self._product_names.append(product.name)
+        if self.stock is not None:
+            self._stock_changed(product.name, self.products[product.name]['amount'], 0)
 
-    def set_discount(self, identifier: Union[str, int], percent: Union[int, float], identifier_type: str = 'name'):
+    def set_discount(self, identifier: str | int, percent: int | float, identifier_type: str = 'name'):
         if not (0 <= percent <= 100):
             raise CustomException("Відсоток знижки має бути від 0 до 100.")
         if identifier_type not in ['name', 'type']:
             raise CustomException("identifier_type має бути 'name' або 'type'.")
 
-        found_match = False
-        for product_data in self.products.values():
-            product_obj = product_data['product_obj']
+        if identifier_type == 'name':
+            names = [identifier] if identifier in self.products else []
+        else:
+            names = self._names_by_type.get(identifier, ())
 
-            if identifier_type == 'name' and product_obj.name == identifier:
-                product_data['discount_percent'] = percent
-                found_match = True
-            elif identifier_type == 'type' and product_obj.type == identifier:
-                product_data['discount_percent'] = percent
-                found_match = True
+        found_match = False
+        for name in names:
+            self.products[name]['discount_percent'] = percent
+            self._unit_prices.pop(name, None)
+            self._unit_prices_cents.pop(name, None)
+            found_match = True
 
         if not found_match:
             raise CustomException(f"Продукт(и) з ідентифікатором '{identifier}' (тип: {identifier_type}) не знайдено.")
 
+    def add_campaign(self, identifier: str, percent: int | float, start: float, end: float,
+                     identifier_type: str = 'name', priority: int = 0) -> Campaign:
+        if not isinstance(percent, (int, float)) or not (0 <= percent <= 100):
+            raise CustomException("Відсоток знижки має бути від 0 до 100.")
+        if identifier_type not in ['name', 'type']:
+            raise CustomException("identifier_type має бути 'name' або 'type'.")
+        if not isinstance(start, (int, float)) or not isinstance(end, (int, float)) or start >= end:
+            raise CustomException("Кампанія має починатися раніше, ніж закінчується.")
+        return self.campaigns.add(identifier, identifier_type, percent, start, end, priority)
+
+    def cancel_campaign(self, campaign: Campaign):
+        self.campaigns.cancel(campaign)
+
     def sell_product(self, product_name: str, amount: int):
         if not isinstance(product_name, str) or not product_name:
             raise CustomException("Назва продукту має бути непорожнім рядком.")
@@ -93,38 +264,230 @@ class ProductStore:
 
         product_data = self.products[product_name]
         current_amount = product_data['amount']
-        product_obj = product_data['product_obj']
-        discount_percent = product_data['discount_percent']
 
         if current_amount < amount:
             raise CustomException(f"Недостатньо '{product_name}' на складі. Доступно: {current_amount}, запитано: {amount}.")
 
-        price_after_premium = product_obj.price * self.PRICE_PREMIUM_FACTOR
-        final_unit_price = price_after_premium * (1 - discount_percent / 100)
+        final_unit_price = self._unit_price(product_name)
 
         product_data['amount'] -= amount
-        self.income += final_unit_price * amount
+        self._add_income(final_unit_price * amount)
+        if self.stock is not None:
+            self._stock_changed(product_name, product_data['amount'], amount)
+        if self.accounting == 'cents':
+            self._add_revenue(product_name, self._unit_price_cents(product_name) * amount)
+
+    def sell_many(self, orders) -> list:
+        if isinstance(orders, dict):
+            orders = orders.items()
+        lines = list(orders)
+
+        requested = {}
+        for product_name, amount in lines:
+            if not isinstance(product_name, str) or not product_name:
+                raise CustomException("Назва продукту має бути непорожнім рядком.")
+            if not isinstance(amount, int) or amount <= 0:
+                raise CustomException("Кількість для продажу має бути додатним цілим числом.")
+            if product_name not in self.products:
+                raise CustomException(f"Продукту '{product_name}' немає в наявності.")
+            requested[product_name] = requested.get(product_name, 0) + amount
+
+        for product_name, amount in requested.items():
+            current_amount = self.products[product_name]['amount']
+            if current_amount < amount:
+                raise CustomException(f"Недостатньо '{product_name}' на складі. Доступно: {current_amount}, запитано: {amount}.")
+
+        unit_prices = {}
+        for product_name, amount in requested.items():
+            unit_prices[product_name] = self._unit_price(product_name)
+            self.products[product_name]['amount'] -= amount
+
+        line_totals = [(product_name, amount, unit_prices[product_name] * amount) for product_name, amount in lines]
+        self._add_income(sum(total for _, _, total in line_totals))
+        if self.accounting == 'cents':
+            for product_name, amount in requested.items():
+                self._add_revenue(product_name, self._unit_price_cents(product_name) * amount)
+        if self.stock is not None:
+            for product_name, amount in requested.items():
+                self._stock_changed(product_name, self.products[product_name]['amount'], amount)
+        return line_totals
+
+    def _add_income(self, value: float):
+        self.income += value
+
+    def _add_revenue(self, product_name: str, cents: int):
+        self.income_cents += cents
+        self._revenue_by_product[product_name] = self._revenue_by_product.get(product_name, 0) + cents
+        product_type = self.products[product_name]['product_obj'].type
+        self._revenue_by_type[product_type] = self._revenue_by_type.get(product_type, 0) + cents
+
+    def set_premium_factor(self, factor: float):
+        if not isinstance(factor, (int, float)) or factor <= 0:
+            raise CustomException("Націнка має бути додатним числом.")
+        self.PRICE_PREMIUM_FACTOR = factor
+        self._unit_prices.clear()
+        self._unit_prices_cents.clear()
+        self._unit_prices_premium = factor
+
+    def _unit_price(self, product_name: str) -> float:
+        if self._unit_prices_premium != self.PRICE_PREMIUM_FACTOR:
+            self._unit_prices.clear()
+            self._unit_prices_cents.clear()
+            self._unit_prices_premium = self.PRICE_PREMIUM_FACTOR
+
+        # Ціна з активною кампанією не кешується: кампанія може закінчитися будь-якої миті
+        if self.campaigns:
+            product = self.products[product_name]['product_obj']
+            percent = self._campaign_percent(product_name, product.type)
+            if percent is not None:
+                return product.price * self.PRICE_PREMIUM_FACTOR * (1 - percent / 100)
+
+        final_unit_price = self._unit_prices.get(product_name)
+        if final_unit_price is None:
+            product_data = self.products[product_name]
+            price_after_premium = product_data['product_obj'].price * self.PRICE_PREMIUM_FACTOR
+            final_unit_price = price_after_premium * (1 - product_data['discount_percent'] / 100)
+            self._unit_prices[product_name] = final_unit_price
+        return final_unit_price
+
+    def _unit_price_cents(self, product_name: str) -> int:
+        # Викликається після _unit_price, тож кеш уже узгоджений з поточною націнкою
+        cents = self._unit_prices_cents.get(product_name)
+        if cents is not None:
+            return cents
+        product_data = self.products[product_name]
+        product = product_data['product_obj']
+        percent = self._campaign_percent(product_name, product.type) if self.campaigns else None
+        if percent is not None:
+            return unit_price_cents(product.price, self.PRICE_PREMIUM_FACTOR, percent)
+        cents = unit_price_cents(product.price, self.PRICE_PREMIUM_FACTOR, product_data['discount_percent'])
+        self._unit_prices_cents[product_name] = cents
+        return cents
+
+    def _campaign_percent(self, product_name: str, product_type: str):
+        # Єдине місце, де читання ціни звертається до розкладу кампаній (і змінює його купи)
+        return self.campaigns.percent_for(product_name, product_type)
 
     def get_income(self) -> float:
         return self.income
 
+    def get_income_exact(self) -> 'Decimal':
+        self._require_cents()
+        return cents_to_decimal(self.income_cents)
+
+    def get_revenue(self, identifier: str, identifier_type: str = 'name') -> 'Decimal':
+        self._require_cents()
+        if identifier_type not in ['name', 'type']:
+            raise CustomException("identifier_type має бути 'name' або 'type'.")
+        revenue = self._revenue_by_product if identifier_type == 'name' else self._revenue_by_type
+        return cents_to_decimal(revenue.get(identifier, 0))
+
+    def get_revenue_by_type(self) -> dict:
+        self._require_cents()
+        return {product_type: cents_to_decimal(cents) for product_type, cents in self._revenue_by_type.items()}
+
+    def track_stock(self, reorder_level: int = None) -> StockTracker:
+        # Вмикає індекси залишків і продажів; продажі до виклику в top_sellers не враховуються
+        self.stock = StockTracker(reorder_level)
+        self.stock.load({name: product_data['amount'] for name, product_data in self.products.items()})
+        return self.stock
+
+    def _stock_changed(self, product_name: str, amount: int, sold: int):
+        self.stock.update(product_name, amount, sold)
+
+    def low_stock(self, threshold: int) -> list:
+        self._require_stock()
+        if not isinstance(threshold, int):
+            raise CustomException("Поріг залишку має бути цілим числом.")
+        return self.stock.low_stock(threshold)
+
+    def top_sellers(self, k: int = 10) -> list:
+        self._require_stock()
+        if not isinstance(k, int) or k <= 0:
+            raise CustomException("k має бути додатним цілим числом.")
+        return self.stock.top_sellers(k)
+
+    def _require_stock(self):
+        if self.stock is None:
+            raise CustomException("Відстеження залишків вимкнено: викличте track_stock().")
+
+    def _require_cents(self):
+        if self.accounting != 'cents':
+            raise CustomException("Точний облік доходу вимкнено: створіть ProductStore(accounting='cents').")
+
     def get_all_products(self) -> list:
-        all_products_info = []
-        for product_name, product_data in self.products.items():
+        return list(self.iter_products())
+
+    def iter_products(self, product_type: str = None, min_amount: int = None, max_amount: int = None,
+                      fields: tuple = None):
+        for _, row in self._iter_rows(0, product_type, min_amount, max_amount, fields):
+            yield row
+
+    def get_products_page(self, limit: int = 100, cursor: int = 0, **filters) -> tuple:
+        if not isinstance(limit, int) or limit <= 0:
+            raise CustomException("Розмір сторінки має бути додатним цілим числом.")
+        if not isinstance(cursor, int) or cursor < 0:
+            raise CustomException("Курсор має бути невід'ємним цілим числом.")
+
+        page = []
+        for position, row in self._iter_rows(cursor, **filters):
+            if len(page) == limit:
+                return page, position
+            page.append(row)
+        return page, None
+
+    def export_products(self, path: str, file_format: str = 'csv', chunk_size: int = 10_000, **filters) -> int:
+        if file_format not in ['csv', 'jsonl']:
+            raise CustomException("file_format має бути 'csv' або 'jsonl'.")
+        import csv
+        import json
+
+        fields = filters.get('fields') or self.PRODUCT_FIELDS
+        rows = self.iter_products(**filters)
+
+        written = 0
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            if file_format == 'csv':
+                writer = csv.DictWriter(f, fieldnames=fields)
+                writer.writeheader()
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                if file_format == 'csv':
+                    writer.writerows(chunk)
+                else:
+                    f.write(''.join(json.dumps(row, ensure_ascii=False) + '\n' for row in chunk))
+                written += len(chunk)
+        return written
+
+    def _iter_rows(self, start: int = 0, product_type: str = None, min_amount: int = None, max_amount: int = None,
+                   fields: tuple = None):
+        # Список назв лише доповнюється: курсор — індекс у ньому, а додавання під час перебору безпечне
+        names = self._product_names
+        position = start
+        while position < len(names):
+            product_name = names[position]
+            position += 1
+            product_data = self.products[product_name]
             product_obj = product_data['product_obj']
             amount = product_data['amount']
-            discount_percent = product_data['discount_percent']
-
-            price_after_premium = product_obj.price * self.PRICE_PREMIUM_FACTOR
-            final_unit_price = price_after_premium * (1 - discount_percent / 100)
+            if product_type is not None and product_obj.type != product_type:
+                continue
+            if min_amount is not None and amount < min_amount:
+                continue
+            if max_amount is not None and amount > max_amount:
+                continue
 
-            all_products_info.append({
+            row = {
                 'name': product_name,
                 'type': product_obj.type,
                 'amount': amount,
-                'unit_price_with_premium_and_discount': round(final_unit_price, 2)
-            })
-        return all_products_info
+                'unit_price_with_premium_and_discount': round(self._unit_price(product_name), 2)
+            }
+            if fields is not None:
+                row = {field: row[field] for field in fields}
+            yield position - 1, row
 
     def get_product_info(self, product_name: str) -> tuple:
         if product_name not in self.products:
@@ -147,5 +510,83 @@ if __name__ == "__main__":
     assert s.get_product_info('Ramen') == ('Ramen', 290)
     print("✅ Продаж успішний. Дані актуальні.")
 
+    s.sell_many([('Ramen', 10), ('Football T-Shirt', 1)])
+    assert s.get_product_info('Ramen') == ('Ramen', 280)
+    try:
+        s.sell_many({'Ramen': 1, 'Football T-Shirt': 100})
+    except CustomException:
+        pass
+    assert s.get_product_info('Ramen') == ('Ramen', 280)
+    print("✅ Пакетний продаж виконано за принципом 'все або нічого'.")
+
+    s.set_discount('Ramen', 50)
+    assert s.get_all_products()[1]['unit_price_with_premium_and_discount'] == 0.98
+    s.set_premium_factor(2.0)
+    assert s.get_all_products()[1]['unit_price_with_premium_and_discount'] == 1.5
+    print("✅ Кеш цін оновлюється після зміни знижки та націнки.")
+
+    page, cursor = s.get_products_page(limit=1, fields=('name', 'amount'))
+    assert page == [{'name': 'Football T-Shirt', 'amount': 9}] and cursor == 1
+    page, cursor = s.get_products_page(limit=1, cursor=cursor, fields=('name', 'amount'))
+    assert page == [{'name': 'Ramen', 'amount': 280}] and cursor is None
+    assert [row['name'] for row in s.iter_products(min_amount=100)] == ['Ramen']
+    print("✅ Посторінковий перегляд і фільтри працюють.")
+
+    records = [('Food', 'Ramen', 1.5, 10), ('Sport', 'Ball', 20, 3), ('Food', 'Ramen', 1.5, 5)]
+    bulk = ProductStore.from_records(records)
+    assert bulk.get_product_info('Ramen') == ('Ramen', 15)
+    assert ProductStore.from_records(records, validate='none').get_all_products() == bulk.get_all_products()
+    try:
+        ProductStore.from_records(records + [('Food', 'Bad', -1, 1)])
+    except CustomException as e:
+        assert str(e).startswith('Запис 3:')
+    print("✅ Масове завантаження каталогу працює.")
+
+    now = [100.0]
+    c = ProductStore()
+    c.campaigns.clock = lambda: now[0]
+    c.add(Product('Food', 'Ramen', 10), 100)
+    c.set_discount('Ramen', 10)
+    c.add_campaign('Food', 20, start=150, end=300, identifier_type='type')
+    late = c.add_campaign('Ramen', 50, start=200, end=250)
+    c.add_campaign('Ramen', 30, start=200, end=400, priority=-1)
+    prices = []
+    for now[0] in (100, 150, 200, 220, 350, 400):
+        if now[0] == 220:
+            c.cancel_campaign(late)
+        prices.append(round(c._unit_price('Ramen'), 2))
+    # постійна 10% -> тип 20% -> назва 50% -> (скасовано) тип 20% -> назва 30% -> постійна 10%
+    assert prices == [11.7, 10.4, 6.5, 10.4, 9.1, 11.7]
+    print("✅ Кампанії знижок вмикаються, перетинаються та закінчуються за розкладом.")
+
+    from decimal import Decimal
+
+    exact = ProductStore(accounting='cents')
+    exact.add(Product('Food', 'Ramen', 0.1), 1_000_000)
+    exact.add(Product('Sport', 'Ball', 1.5), 10)
+    exact.set_discount('Ball', 50)
+    for _ in range(100_000):
+        exact.sell_product('Ramen', 1)
+    exact.sell_many([('Ramen', 5), ('Ball', 1)])
+    assert exact.get_income_exact() == Decimal('13001.63')
+    assert exact.get_revenue('Ball') == Decimal('0.98')
+    assert exact.get_revenue_by_type() == {'Food': Decimal('13000.65'), 'Sport': Decimal('0.98')}
+    print(f"✅ Точний облік доходу: {exact.get_income_exact()} (float: {exact.get_income()!r}).")
+
+    tracked = ProductStore()
+    for i in range(5):
+        tracked.add(Product('Food', f"Item-{i}", 1), 10 * (i + 1))
+    alerts = []
+    tracked.track_stock(reorder_level=5).alerts.subscribe(alerts.append)
+    tracked.sell_product('Item-4', 20)
+    tracked.sell_product('Item-0', 6)
+    tracked.sell_many([('Item-0', 1), ('Item-2', 26)])
+    tracked.add(Product('Food', 'Item-0', 1), 10)
+    assert tracked.low_stock(10) == [('Item-2', 4)]
+    assert tracked.low_stock(20) == [('Item-2', 4), ('Item-0', 13), ('Item-1', 20)]
+    assert tracked.top_sellers(2) == [('Item-2', 26), ('Item-4', 20)]
+    assert [(alert.data['name'], alert.data['amount']) for alert in alerts] == [('Item-0', 4), ('Item-2', 4)]
+    print("✅ Залишки, лідери продажів і сповіщення про дозамовлення працюють.")
+
     # Інші перевірки та демонстрації...
     print("\nВсі тести пройшли успішно!")
\ No newline at end of file